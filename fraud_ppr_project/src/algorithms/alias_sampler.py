@@ -0,0 +1,127 @@
+# src/algorithms/alias_sampler.py
+
+import numpy as np
+from scipy import sparse
+
+
+def _segment_cumsum(values: np.ndarray, segment: np.ndarray) -> np.ndarray:
+    """Cumulative sum of values restarted wherever segment changes (segment is sorted)."""
+    total = np.cumsum(values)
+    first = np.searchsorted(segment, segment, side="left")
+    return total - np.concatenate(([0.0], total))[first]
+
+
+class AliasSampler:
+    """
+    O(1) weighted neighbour sampling for every row of a transition matrix.
+
+    Walker's alias method, with the tables stored flat and aligned with the
+    CSR arrays: entry k of row u (k in indptr[u]..indptr[u+1]-1) holds
+    prob[k] and alias[k]. A draw from row u picks a slot k uniformly and
+    returns edge k with probability prob[k], otherwise edge alias[k].
+
+    The tables are built in one vectorized pass (no loop over nodes).
+    Within a row, the slots with scaled weight q < 1 ("small") are paired
+    with the others ("large") in order, as in Vose's construction: listing
+    the deficits 1 - q of the small slots and the excesses q - 1 of the
+    large slots as two running sums, a small slot takes its alias from the
+    large slot whose excess interval contains the start of its deficit,
+    and a large slot that runs out is topped up by the next large slot.
+    The pairing is found with np.searchsorted over row-shifted running sums.
+
+    Attributes
+    ----------
+    indptr, indices : np.ndarray
+        CSR structure of the matrix.
+    degree : np.ndarray
+        Number of out-edges of every row.
+    prob : np.ndarray
+        Probability of keeping slot k.
+    alias : np.ndarray
+        Edge position used when slot k is not kept.
+    """
+
+    def __init__(self, M: sparse.csr_matrix) -> None:
+        indptr = M.indptr.astype(np.int64)
+        n = M.shape[0]
+        nnz = int(indptr[-1])
+
+        degree = np.diff(indptr)
+        row = np.repeat(np.arange(n), degree)
+        # Weights scaled to mean 1 within each row (all-zero rows: uniform)
+        row_sum = np.bincount(row, weights=M.data, minlength=n)
+        weight = np.where(row_sum[row] > 0, M.data, 1.0)
+        row_sum = np.where(row_sum > 0, row_sum, degree)
+        q = weight * degree[row] / row_sum[row]
+
+        prob = np.ones(nnz, dtype=np.float64)
+        alias = np.arange(nnz, dtype=np.int64)
+
+        small = np.flatnonzero(q < 1.0)
+        large = np.flatnonzero(q >= 1.0)
+        row_s, row_l = row[small], row[large]
+
+        # Running deficit (small) and excess (large) within each row
+        deficit_end = _segment_cumsum(1.0 - q[small], row_s)
+        deficit_start = deficit_end - (1.0 - q[small])
+        excess_end = _segment_cumsum(q[large] - 1.0, row_l)
+
+        # Small slots: alias = large slot whose excess covers the deficit
+        # start. Shifting by indptr[row] makes the sums increase across rows
+        # (within a row they stay below the degree), so one searchsorted
+        # serves all rows.
+        first_l = np.searchsorted(row_l, row_s, side="left")
+        last_l = np.searchsorted(row_l, row_s, side="right") - 1
+        has_large = last_l >= first_l
+        j = np.searchsorted(excess_end + indptr[row_l], deficit_start + indptr[row_s], side="right")
+        j = np.clip(j, first_l, np.maximum(last_l, first_l))
+
+        prob[small[has_large]] = q[small[has_large]]
+        alias[small[has_large]] = large[j[has_large]]
+
+        # Large slots that run out: the last small slot assigned to them (or
+        # to an earlier large slot of the row) overdraws them, and the next
+        # large slot of the row covers the rest. Deriving this from j keeps
+        # both decisions consistent under rounding.
+        if small.size > 0 and large.size > 0:
+            i = np.searchsorted(j, np.arange(large.size), side="right") - 1
+            i_valid = np.maximum(i, 0)
+            next_same_row = np.zeros(large.size, dtype=bool)
+            next_same_row[:-1] = row_l[1:] == row_l[:-1]
+            overdraw = deficit_end[i_valid] - excess_end
+            drained = (i >= 0) & (row_s[i_valid] == row_l) & next_same_row & (overdraw > 0.0)
+
+            prob[large[drained]] = np.clip(1.0 - overdraw[drained], 0.0, 1.0)
+            alias[large[drained]] = large[np.flatnonzero(drained) + 1]
+
+        self.indptr = indptr
+        self.indices = M.indices
+        self.degree = degree
+        self.prob = prob
+        self.alias = alias
+
+    def sample_edges(self, nodes: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """
+        Draw one out-edge position for every node in nodes.
+        All nodes must have at least one out-edge.
+        """
+        # One uniform per draw: its integer part picks the slot,
+        # its fractional part is the keep/alias coin
+        x = rng.random(nodes.size) * self.degree[nodes]
+        slot = np.minimum(x.astype(np.int64), self.degree[nodes] - 1)
+        k = self.indptr[nodes] + slot
+        return np.where(x - slot < self.prob[k], k, self.alias[k])
+
+    def sample(self, nodes: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Draw one out-neighbour for every node in nodes (none may be dangling)."""
+        return self.indices[self.sample_edges(nodes, rng)]
+
+    def sample_one(self, node: int, u: float) -> int:
+        """Scalar version of sample for a single node and a uniform u in [0, 1)."""
+        deg = int(self.degree[node])
+        x = u * deg
+        slot = min(int(x), deg - 1)
+        k = int(self.indptr[node]) + slot
+        if x - slot >= self.prob[k]:
+            k = int(self.alias[k])
+        return int(self.indices[k])
@@ -1,63 +1,358 @@
 # src/algorithms/ppr_monte_carlo.py
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+from typing import Optional, Tuple, Union
 import numpy as np
 from scipy import sparse
+from src.algorithms.alias_sampler import AliasSampler
+from src.algorithms.ppr_power import _personalization
+from src.algorithms.prepared_graph import PreparedGraph, prepare_graph
+from src.algorithms.solve_report import SolveReport
 
-def personalized_pagerank_monte_carlo(A, alpha=0.15, personalize=None, num_walks=1000, max_steps=50):
+# Visits buffered before they are folded into the counts with np.bincount
+_VISIT_BUFFER = 1 << 22
+
+# Default walks per random stream. The split depends only on num_walks and
+# the batch size, so the result for a given seed is the same for any
+# number of workers.
+_WALK_CHUNK = 1 << 14
+
+# Default number of stopping checks of the adaptive mode per num_walks,
+# and the smallest batch it splits the walks into
+_ADAPTIVE_CHECKS = 10
+_MIN_BATCH = 100
+
+
+# Visit counts, squared per-walk counts (optional) and walks (optional)
+_EngineResult = Tuple[np.ndarray, Optional[np.ndarray], Optional[Tuple[np.ndarray, np.ndarray]]]
+
+
+def _node_dtype(n_nodes: int):
+    """Smallest integer type used to store the node ids of kept walks."""
+    return np.int32 if n_nodes <= np.iinfo(np.int32).max else np.int64
+
+
+def _walks_python(sampler: AliasSampler, alpha, personalize, num_walks, max_steps, rng,
+                  squares: bool = False, keep_walks: bool = False) -> _EngineResult:
+    """
+    Reference engine: one walk and one step at a time.
+
+    Returns the visit counts per node; if squares is set, the sum over
+    walks of the squared per-walk visit counts (for error bars); and if
+    keep_walks is set, the walks as (visits, lengths) (see the walks
+    returned by personalized_pagerank_monte_carlo).
+    """
+    n = personalize.shape[0]
+    counts = np.zeros(n, dtype=np.int64)
+    sq = np.zeros(n, dtype=np.int64) if squares else None
+    degree = sampler.degree
+    kept = []
+
+    for _ in range(num_walks):
+        current = rng.choice(n, p=personalize)
+        visits = []
+
+        for step in range(max_steps):
+            counts[current] += 1
+            visits.append(current)
+
+            if rng.random() > alpha:
+                if degree[current] > 0:
+                    current = sampler.sample_one(current, rng.random())
+                else:
+                    break  # Dead end
+            else:
+                break  # Teleport
+
+        if squares:
+            nodes, per_walk = np.unique(visits, return_counts=True)
+            sq[nodes] += per_walk ** 2
+        if keep_walks:
+            kept.append(visits)
+
+    walks = None
+    if keep_walks:
+        lengths = np.array([len(v) for v in kept], dtype=np.int64)
+        walks = (np.array([u for v in kept for u in v], dtype=_node_dtype(n)), lengths)
+    return counts, sq, walks
+
+
+def _walks_vectorized(sampler: AliasSampler, alpha, personalize, num_walks, max_steps, rng,
+                      squares: bool = False, keep_walks: bool = False) -> _EngineResult:
+    """
+    Lock-step engine: all walks advance together as arrays.
+
+    Each step records the current positions, draws the continue/stop coin
+    for every walk, drops the walks that stopped or hit a dead end, and
+    samples the next node of the others from the graph's alias tables.
+    Same return values as _walks_python.
+    """
+    n = personalize.shape[0]
+    degree = sampler.degree
+    counts = np.zeros(n, dtype=np.int64)
+    sq = np.zeros(n, dtype=np.int64) if squares else None
+
+    # Start nodes drawn from the personalization vector
+    seed_cdf = np.cumsum(personalize)
+    current = np.searchsorted(seed_cdf, rng.random(num_walks) * seed_cdf[-1], side="right")
+    np.minimum(current, n - 1, out=current)
+    walk_id = np.arange(num_walks, dtype=np.int64)
+
+    # Walk ids of the visits are needed for squares and for the walks
+    by_walk = squares or keep_walks
+    pending = []
+    pending_ids = []
+    n_pending = 0
+    for step in range(max_steps):
+        if current.size == 0:
+            break
+        pending.append(current)
+        n_pending += current.size
+        if by_walk:
+            pending_ids.append(walk_id)
+        elif n_pending >= _VISIT_BUFFER:
+            counts += np.bincount(np.concatenate(pending), minlength=n)
+            pending, n_pending = [], 0
+
+        # Continue with probability 1 - alpha, and only out of non-dangling nodes
+        alive = (rng.random(current.size) > alpha) & (degree[current] > 0)
+        current = sampler.sample(current[alive], rng)
+        if by_walk:
+            walk_id = walk_id[alive]
+
+    walks = None
+    if pending:
+        visits = np.concatenate(pending)
+        counts += np.bincount(visits, minlength=n)
+        if squares:
+            # Visits per (walk, node) pair
+            pairs, per_walk = np.unique(np.concatenate(pending_ids) * n + visits, return_counts=True)
+            sq += np.bincount(pairs % n, weights=per_walk.astype(np.float64) ** 2, minlength=n).astype(np.int64)
+        if keep_walks:
+            # Visits arrive step by step; place visit t of walk w at offset[w] + t
+            ids = np.concatenate(pending_ids)
+            lengths = np.bincount(ids, minlength=num_walks)
+            steps = np.repeat(np.arange(len(pending)), [part.size for part in pending])
+            packed = np.empty(visits.size, dtype=_node_dtype(n))
+            packed[(np.cumsum(lengths) - lengths)[ids] + steps] = visits
+            walks = (packed, lengths)
+    return counts, sq, walks
+
+
+_ENGINES = {"vectorized": _walks_vectorized, "python": _walks_python}
+
+# Per-process copy of the sampling tables (set by _init_worker)
+_worker_state = {}
+
+
+def _init_worker(sampler: AliasSampler, personalize: np.ndarray) -> None:
+    _worker_state["sampler"] = sampler
+    _worker_state["personalize"] = personalize
+
+
+def _run_chunk(engine: str, alpha, num_walks, max_steps, seed_seq: np.random.SeedSequence, squares: bool,
+               keep_walks: bool):
+    """Visit counts of one chunk of walks, in a worker process."""
+    rng = np.random.default_rng(seed_seq)
+    return _ENGINES[engine](
+        _worker_state["sampler"], alpha, _worker_state["personalize"], num_walks, max_steps, rng, squares, keep_walks
+    )
+
+
+def _chunk_results(engine, sampler, alpha, personalize, max_steps, chunk_sizes, streams, n_workers, squares,
+                   keep_walks):
+    """
+    Yield the (counts, squares, walks) of every chunk, in chunk order.
+
+    With several workers, at most two chunks per worker are in flight, so
+    a consumer that stops early does not pay for the remaining chunks.
+    """
+    if n_workers == 1 or len(chunk_sizes) == 1:
+        walk = _ENGINES[engine]
+        for size, stream in zip(chunk_sizes, streams):
+            yield walk(sampler, alpha, personalize, size, max_steps, np.random.default_rng(stream), squares,
+                       keep_walks)
+        return
+
+    workers = min(n_workers, len(chunk_sizes))
+    todo = iter(zip(chunk_sizes, streams))
+    in_flight = deque()
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(sampler, personalize)) as pool:
+        try:
+            for size, stream in todo:
+                in_flight.append(pool.submit(_run_chunk, engine, alpha, size, max_steps, stream, squares, keep_walks))
+                if len(in_flight) >= 2 * workers:
+                    break
+            while in_flight:
+                result = in_flight.popleft().result()
+                for size, stream in todo:
+                    in_flight.append(pool.submit(_run_chunk, engine, alpha, size, max_steps, stream, squares, keep_walks))
+                    break
+                yield result
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+def _standard_errors(counts: np.ndarray, sq: np.ndarray, n_walks: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean visits per walk and its standard error, for every node."""
+    mean = counts / n_walks
+    var = np.maximum(sq / n_walks - mean ** 2, 0.0)
+    return mean, np.sqrt(var / max(n_walks - 1, 1))
+
+
+def personalized_pagerank_monte_carlo(A: Union[sparse.spmatrix, PreparedGraph], alpha=0.15, personalize=None, num_walks=1000, max_steps=50,
+                                      engine: str = "vectorized", seed: Optional[int] = None, n_workers: int = 1,
+                                      stop_top_k: Optional[int] = None, confidence: float = 0.95,
+                                      time_budget: Optional[float] = None, return_stderr: bool = False,
+                                      batch_size: Optional[int] = None, return_walks: bool = False,
+                                      report: Optional[SolveReport] = None):
     """
     Monte Carlo approximation of Personalized PageRank.
-    
+
     Parameters:
     -----------
-    A : scipy.sparse.csr_matrix
-        Adjacency matrix of the graph
+    A : scipy.sparse.csr_matrix or PreparedGraph
+        Adjacency matrix of the graph, or its prepared transition structure
     alpha : float
         Damping factor (probability to continue the random walk)
     num_walks : int
-        Number of random walks to simulate
+        Number of random walks to simulate (the maximum in adaptive mode)
     max_steps : int
         Maximum length of each random walk
     personalize : np.ndarray, optional
         Personalization vector. If None, uniform distribution is used.
-    
+    engine : str
+        "vectorized" advances all walks together with NumPy arrays;
+        "python" simulates them one step at a time (reference version).
+    seed : int, optional
+        Seed of the random streams. The walks are split into batches of
+        batch_size, each with its own stream spawned from
+        np.random.SeedSequence(seed), so the same seed and batch_size give
+        bit-identical scores for any n_workers.
+    n_workers : int
+        Number of worker processes the chunks are spread over.
+    stop_top_k : int, optional
+        Adaptive mode: walks run in batches (see batch_size) and stop as
+        soon as the top-K nodes are separated from the rest, i.e. the
+        lowest lower confidence bound in the top K exceeds the highest
+        upper bound outside it. Bounds are per-node normal intervals at
+        the given confidence (no multiple-comparison correction).
+    confidence : float
+        Confidence level of the intervals, in (0, 1).
+    time_budget : float, optional
+        Stop after this many seconds of walking even if the top K is not
+        separated yet (checked after every batch).
+    return_stderr : bool
+        Also return the standard error of every score.
+    batch_size : int, optional
+        Walks per random stream, and per stopping check in adaptive mode.
+        Defaults to 16384, and in adaptive mode to a tenth of num_walks
+        (at least 100, at most 16384) so that small runs can stop early.
+    return_walks : bool
+        Also return the walks behind the scores, e.g. to build a
+        WalkIndex from them without simulating them again.
+    report : SolveReport, optional
+        Filled with setup/simulation times and the number of walk steps.
+
     Returns:
     --------
     scores : np.ndarray
         PageRank scores for each node
+    stderr : np.ndarray
+        Standard error of each score (only if return_stderr is set)
+    walks : tuple of np.ndarray
+        (visits, lengths): the nodes visited by all walks, concatenated
+        walk after walk, and the number of visits of every walk (only if
+        return_walks is set)
     """
-    n = A.shape[0]
-    
-    if personalize is None:
-        personalize = np.ones(n) / n
-    else:
-        personalize = personalize / personalize.sum()
-    
-    scores = np.zeros(n)
-    
-    # Precompute row distributions for faster access
-    row_distributions = []
-    for i in range(n):
-        neighbors = A[i].indices
-        if len(neighbors) > 0:
-            probs = A[i].data
-            probs = probs / probs.sum()
-            row_distributions.append((neighbors, probs))
-        else:
-            row_distributions.append((np.array([]), np.array([])))
-    
+    if engine not in _ENGINES:
+        raise ValueError(f"Unknown Monte Carlo engine: {engine}")
+    if n_workers < 1:
+        raise ValueError("n_workers must be at least 1")
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must be in (0, 1)")
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    t_start = time.perf_counter()
+    G = prepare_graph(A)
+    n = G.n_nodes
+
+    personalize = _personalization(personalize, n)
+
+    sampler = G.alias_sampler  # built once per graph, counted as setup
+
+    adaptive = stop_top_k is not None and stop_top_k > 0
+    if batch_size is None:
+        batch_size = _WALK_CHUNK
+        if adaptive:
+            batch_size = min(batch_size, max(-(-num_walks // _ADAPTIVE_CHECKS), _MIN_BATCH))
+
+    # One independent stream per batch of walks
+    chunk_sizes = [min(batch_size, num_walks - start) for start in range(0, num_walks, batch_size)]
+    streams = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+
+    squares = adaptive or return_stderr
+    k_top = min(stop_top_k, n - 1) if adaptive else 0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+
     # Perform random walks
-    for _ in range(num_walks):
-        current = np.random.choice(n, p=personalize)
-        
-        for step in range(max_steps):
-            scores[current] += 1
-            
-            if np.random.random() > alpha:
-                neighbors, probs = row_distributions[current]
-                if len(neighbors) > 0:
-                    current = np.random.choice(neighbors, p=probs)
-                else:
-                    break  # Dead end
-            else:
-                break  # Teleport
-    
-    return scores / (num_walks * max_steps)
\ No newline at end of file
+    t_solve = time.perf_counter()
+    counts = np.zeros(n, dtype=np.int64)
+    sq = np.zeros(n, dtype=np.int64) if squares else None
+    walks_done = 0
+    separated = False
+    out_of_time = False
+
+    kept = []
+    batches = _chunk_results(
+        engine, sampler, alpha, personalize, max_steps, chunk_sizes, streams, n_workers, squares, return_walks
+    )
+    for size, (part, part_sq, part_walks) in zip(chunk_sizes, batches):
+        counts += part
+        walks_done += size
+        if squares:
+            sq += part_sq
+        if return_walks:
+            kept.append(part_walks)
+
+        if adaptive:
+            mean, se = _standard_errors(counts, sq, walks_done)
+            top = np.argpartition(mean, n - k_top)[n - k_top:]
+            rest = np.ones(n, dtype=bool)
+            rest[top] = False
+            if (mean[top] - z * se[top]).min() > (mean[rest] + z * se[rest]).max():
+                separated = True
+                break
+            if time_budget is not None and time.perf_counter() - t_solve >= time_budget:
+                out_of_time = True
+                break
+    batches.close()
+
+    scores = counts / (walks_done * max_steps)
+
+    if report is not None:
+        report.solver = "monte_carlo"
+        report.n_iter = walks_done
+        report.converged = separated or not adaptive
+        report.setup_time += t_solve - t_start
+        report.solve_time += time.perf_counter() - t_solve
+        report.extra["num_walks"] = walks_done
+        report.extra["batch_size"] = batch_size
+        report.extra["n_workers"] = n_workers
+        report.extra["walk_steps"] = int(counts.sum())
+        if adaptive:
+            report.extra["topk_separated"] = separated
+            report.extra["time_budget_hit"] = out_of_time
+        report.finish()
+
+    results = [scores]
+    if return_stderr:
+        _, se = _standard_errors(counts, sq, walks_done)
+        results.append(se / max_steps)
+    if return_walks:
+        results.append(tuple(np.concatenate(arrays) for arrays in zip(*kept)))
+    return tuple(results) if len(results) > 1 else scores
@@ -0,0 +1,283 @@
+# src/algorithms/ppr_multiprocess.py
+
+import multiprocessing as mp
+import time
+import weakref
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+from typing import Dict, Optional, Tuple, Union
+import numpy as np
+from scipy import sparse
+from src.algorithms.ppr_power import _personalization, _start_vector
+from src.algorithms.prepared_graph import PreparedGraph, prepare_graph
+from src.algorithms.solve_report import SolveReport
+from src.algorithms.spmv import balanced_row_blocks, csr_rows_into
+
+# Commands written to the control block by the parent
+_CMD_ITERATE = 0.0
+_CMD_EXIT = 1.0
+
+
+def _attach(specs: Dict[str, tuple]) -> Tuple[list, Dict[str, np.ndarray]]:
+    """Map the shared blocks described by specs into numpy arrays."""
+    handles, arrays = [], {}
+    for key, (name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        handles.append(shm)
+        arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    return handles, arrays
+
+
+def _close_all(handles: list) -> None:
+    for shm in handles:
+        try:
+            shm.close()
+        except BufferError:  # arrays still point into the block
+            pass
+
+
+def _worker(worker_id: int, start: int, end: int, specs: Dict[str, tuple], ctrl, barrier) -> None:
+    """
+    Worker loop: owns rows [start, end) of MT and writes the same rows of
+    the next rank vector on every iteration.
+
+    Per iteration the parent and all workers meet twice at the barrier:
+    once after the parent has set the command, once after every worker
+    has written its rows.
+    """
+    handles, arr = _attach(specs)
+    try:
+        n = arr["p"].shape[0]
+        lo, hi = int(arr["indptr"][start]), int(arr["indptr"][end])
+        block_ptr = arr["indptr"][start:end + 1] - lo
+        block_idx = arr["indices"][lo:hi]
+        block_val = arr["data"][lo:hi]
+
+        dangling = arr["dangling"]
+        own_dangling = dangling[(dangling >= start) & (dangling < end)]
+        p_own = arr["p"][start:end]
+        ranks, dang, err = arr["ranks"], arr["dang"], arr["err"]
+        scratch = np.empty(end - start, dtype=np.float64)
+
+        while True:
+            barrier.wait()
+            if ctrl[0] == _CMD_EXIT:
+                break
+
+            alpha = ctrl[1]
+            src = int(ctrl[2])
+            x = ranks[src]
+            out = ranks[1 - src, start:end]
+            dangling_mass = dang[src].sum()
+
+            # r = (1-α)*walk + ( (1-α)*dangling_mass + α ) * p
+            csr_rows_into(block_ptr, block_idx, block_val, n, x, out)
+            out *= 1.0 - alpha
+            np.multiply(p_own, (1.0 - alpha) * dangling_mass + alpha, out=scratch)
+            out += scratch
+
+            np.subtract(out, x[start:end], out=scratch)
+            err[worker_id] = np.abs(scratch, out=scratch).sum()
+            dang[1 - src, worker_id] = ranks[1 - src, own_dangling].sum()
+
+            barrier.wait()
+    except BrokenBarrierError:
+        pass
+    except BaseException:
+        barrier.abort()
+        raise
+    finally:
+        _close_all(handles)
+
+
+def _shutdown(processes: list, handles: list, ctrl, barrier) -> None:
+    """Stop the workers and release the shared memory."""
+    if any(proc.is_alive() for proc in processes):
+        ctrl[0] = _CMD_EXIT
+        try:
+            barrier.wait(timeout=5.0)
+        except BrokenBarrierError:
+            pass
+    for proc in processes:
+        proc.join(timeout=5.0)
+        if proc.is_alive():
+            proc.terminate()
+    _close_all(handles)
+    for shm in handles:
+        shm.unlink()
+
+
+class SharedMemoryPPR:
+    """
+    Multiprocess power iteration engine.
+
+    The transposed transition matrix, the personalization vector and two
+    rank buffers are placed in multiprocessing.shared_memory. Each worker
+    process owns a contiguous row partition of MT (balanced by nonzeros)
+    and computes those rows of the next rank vector; the processes
+    synchronize on a barrier once per iteration. The whole loop body runs
+    in the workers, so nothing is serialized on the parent's GIL.
+
+    The workers stay alive between solves, so one engine can answer many
+    queries on the same graph. Call close() (or use it as a context
+    manager) to stop them.
+    """
+
+    def __init__(self, A: Union[sparse.spmatrix, PreparedGraph], n_workers: int = 2) -> None:
+        if n_workers < 1:
+            raise ValueError("n_workers must be at least 1")
+
+        G = prepare_graph(A)
+        self.n_nodes = n = G.n_nodes
+        MT = G.MT
+        self.blocks = balanced_row_blocks(MT.indptr, n_workers)
+        self.n_workers = len(self.blocks)
+
+        arrays = {
+            "indptr": MT.indptr.astype(np.int64),
+            "indices": MT.indices,
+            "data": MT.data.astype(np.float64),
+            "dangling": G.dangling.astype(np.int64),
+            "p": np.zeros(n, dtype=np.float64),
+            "ranks": np.zeros((2, n), dtype=np.float64),
+            "dang": np.zeros((2, self.n_workers), dtype=np.float64),
+            "err": np.zeros(self.n_workers, dtype=np.float64),
+        }
+
+        # Copy every array into its own shared block
+        self._handles = []
+        self._arrays: Dict[str, np.ndarray] = {}
+        specs = {}
+        for key, value in arrays.items():
+            shm = shared_memory.SharedMemory(create=True, size=max(value.nbytes, 1))
+            self._handles.append(shm)
+            shared = np.ndarray(value.shape, dtype=value.dtype, buffer=shm.buf)
+            shared[...] = value
+            self._arrays[key] = shared
+            specs[key] = (shm.name, value.shape, value.dtype)
+
+        # Control block: command, alpha, index of the source rank buffer
+        ctx = mp.get_context()
+        self._ctrl = ctx.RawArray("d", 3)
+        self._barrier = ctx.Barrier(self.n_workers + 1)
+        self._processes = [
+            ctx.Process(target=_worker, args=(w, a, b, specs, self._ctrl, self._barrier), daemon=True)
+            for w, (a, b) in enumerate(self.blocks)
+        ]
+        for proc in self._processes:
+            proc.start()
+
+        self._finalizer = weakref.finalize(
+            self, _shutdown, self._processes, self._handles, self._ctrl, self._barrier
+        )
+
+    def _step(self, alpha: float, src: int) -> float:
+        """Run one iteration in the workers; return the L1 change."""
+        ctrl = self._ctrl
+        ctrl[0], ctrl[1], ctrl[2] = _CMD_ITERATE, alpha, src
+        try:
+            self._barrier.wait()  # start
+            self._barrier.wait()  # every row written
+        except BrokenBarrierError:
+            self.close()
+            raise RuntimeError("A PPR worker process failed")
+        return float(self._arrays["err"].sum())
+
+    def solve(
+        self,
+        alpha: float = 0.15,
+        max_iter: int = 100,
+        tol: float = 1e-6,
+        personalize: Optional[np.ndarray] = None,
+        start_vec: Optional[np.ndarray] = None,
+        report: Optional[SolveReport] = None,
+    ) -> Tuple[np.ndarray, int, float]:
+        """
+        Compute Personalized PageRank; same arguments and return values
+        as personalized_pagerank.
+        """
+        if not self._finalizer.alive:
+            raise ValueError("The engine has been closed")
+        if alpha <= 0.0 or alpha >= 1.0:
+            raise ValueError("alpha must be in (0, 1)")
+
+        t_start = time.perf_counter()
+        n = self.n_nodes
+
+        p = _personalization(personalize, n)
+        r = _start_vector(start_vec, p)
+
+        arr = self._arrays
+        arr["p"][:] = p
+        arr["ranks"][0] = r
+        arr["dang"][0] = 0.0
+        arr["dang"][0, 0] = r[arr["dangling"]].sum()
+
+        final_err = float("inf")
+        n_iter = 0
+        src = 0
+        t_solve = time.perf_counter()
+        t_iter = t_solve
+
+        for it in range(1, max_iter + 1):
+            final_err = self._step(alpha, src)
+            src = 1 - src
+            n_iter = it
+
+            if report is not None:
+                now = time.perf_counter()
+                report.record_iteration(final_err, now - t_iter, float(arr["dang"][1 - src].sum()))
+                t_iter = now
+            if final_err < tol:
+                break
+
+        r = arr["ranks"][src].copy()
+        if r.sum() > 0:
+            r /= r.sum()
+
+        if report is not None:
+            report.solver = "multiprocess"
+            report.n_iter = n_iter
+            report.converged = final_err < tol
+            report.spmv_count += n_iter
+            report.setup_time += t_solve - t_start
+            report.solve_time += time.perf_counter() - t_solve
+            report.extra["n_workers"] = self.n_workers
+            report.finish()
+
+        return r, n_iter, final_err
+
+    def close(self) -> None:
+        """Stop the worker processes and free the shared memory."""
+        self._arrays = {}
+        self._finalizer()
+
+    def __enter__(self) -> "SharedMemoryPPR":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def personalized_pagerank_multiprocess(
+    A: Union[sparse.spmatrix, PreparedGraph],
+    alpha: float = 0.15,
+    max_iter: int = 100,
+    tol: float = 1e-6,
+    personalize: Optional[np.ndarray] = None,
+    start_vec: Optional[np.ndarray] = None,
+    n_workers: int = 2,
+    report: Optional[SolveReport] = None,
+) -> Tuple[np.ndarray, int, float]:
+    """
+    One-off Personalized PageRank solve on a SharedMemoryPPR engine.
+
+    Starting the workers and copying the graph into shared memory is part
+    of the setup time; keep a SharedMemoryPPR around to amortize it over
+    several queries.
+    """
+    t_start = time.perf_counter()
+    with SharedMemoryPPR(A, n_workers) as engine:
+        if report is not None:
+            report.setup_time += time.perf_counter() - t_start
+        return engine.solve(alpha, max_iter, tol, personalize, start_vec, report)
@@ -0,0 +1,376 @@
+# src/algorithms/ppr_push.py
+
+import time
+from typing import List, Optional, Tuple, Union
+import numpy as np
+from scipy import sparse
+from src.algorithms.ppr_power import _personalization
+from src.algorithms.prepared_graph import PreparedGraph, prepare_graph
+from src.algorithms.solve_report import SolveReport
+
+
+def _seed_entries(personalize: Optional[np.ndarray], n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the nonzero entries (indices, values) of the normalized personalization vector."""
+    p = _personalization(personalize, n)
+    seed_idx = np.flatnonzero(p)
+    return seed_idx, p[seed_idx]
+
+
+def personalized_pagerank_push(
+    A: Union[sparse.spmatrix, PreparedGraph],
+    alpha: float = 0.15,
+    personalize: Optional[np.ndarray] = None,
+    epsilon: float = 1e-6,
+    frontier_density: float = 0.1,
+    report: Optional[SolveReport] = None,
+) -> Tuple[sparse.csr_matrix, int, float]:
+    """
+    Local forward-push approximation of Personalized PageRank
+    (Andersen, Chung & Lang).
+
+    Maintains an estimate vector and a residual vector. A node is pushed
+    only while its residual exceeds epsilon * degree, so the work depends on
+    the neighbourhood of the seeds rather than on the size of the graph.
+    Pushes run in synchronous rounds (all nodes above the threshold at
+    once, as in reverse_push). A round whose frontier holds more than
+    frontier_density * n nodes pushes the whole residual vector instead,
+    with one sparse product (the dense phase of the frontier mode of
+    personalized_pagerank): past that size a frontier step costs more than
+    a dense one. Local rounds resume once the frontier is small again.
+    Dangling nodes send their residual back to the personalization vector,
+    matching the power iteration in ppr_power.py.
+
+    Parameters
+    ----------
+    A : scipy.sparse.csr_matrix or PreparedGraph
+        Adjacency matrix of the graph, or its prepared transition structure.
+    alpha : float
+        Teleport probability, in (0, 1).
+    personalize : np.ndarray, optional
+        Personalization vector. If None, uniform distribution is used.
+    epsilon : float
+        Residual threshold per unit of degree.
+    frontier_density : float
+        Fraction of the nodes above which a round is done densely, in
+        (0, 1]; 1 keeps every round local.
+    report : SolveReport, optional
+        Filled with timings, the push count and the residual mass.
+
+    Returns
+    -------
+    scores : scipy.sparse.csr_matrix, shape (1, n)
+        Estimated PPR scores; only touched nodes are stored.
+    n_pushes : int
+        Number of push operations performed.
+    residual_mass : float
+        Remaining residual mass, an upper bound on the L1 error of scores.
+    """
+    if alpha <= 0.0 or alpha >= 1.0:
+        raise ValueError("alpha must be in (0, 1)")
+    if epsilon <= 0.0:
+        raise ValueError("epsilon must be positive")
+    if not 0.0 < frontier_density <= 1.0:
+        raise ValueError("frontier_density must be in (0, 1]")
+
+    t_start = time.perf_counter()
+    G = prepare_graph(A)
+    n = G.n_nodes
+    M = G.M
+
+    seed_idx, seed_val = _seed_entries(personalize, n)
+
+    # Push threshold per node: epsilon * number of out-neighbours
+    threshold = epsilon * np.maximum(np.diff(M.indptr), 1)
+
+    estimate = np.zeros(n, dtype=np.float64)
+    residual = np.zeros(n, dtype=np.float64)
+    touched = np.zeros(n, dtype=bool)
+
+    residual[seed_idx] = seed_val
+    touched[seed_idx] = True
+    frontier = seed_idx[residual[seed_idx] > threshold[seed_idx]]
+
+    # Synchronous rounds: every node above its threshold is pushed at once,
+    # so the Python overhead is per round rather than per node.
+    dense_limit = frontier_density * n
+    spmv = G.spmv()
+    scratch = np.empty(n, dtype=np.float64)
+    t_solve = time.perf_counter()
+    n_pushes = 0
+    n_rounds = 0
+    n_dense = 0
+    while frontier.size > 0:
+        n_rounds += 1
+        if frontier.size > dense_limit:
+            # Dense round: push every residual with one sparse product
+            n_pushes += int(np.count_nonzero(residual))
+            n_dense += 1
+            estimate += alpha * residual
+            dangling_mass = float(residual[G.dangling].sum())
+            spmv(residual, scratch)
+            np.multiply(scratch, 1.0 - alpha, out=residual)
+            residual[seed_idx] += (1.0 - alpha) * dangling_mass * seed_val
+            touched |= residual > 0.0
+            frontier = np.flatnonzero(residual > threshold)
+            continue
+
+        r_f = residual[frontier]
+        estimate[frontier] += alpha * r_f
+        residual[frontier] = 0.0
+        n_pushes += frontier.size
+
+        # Out-neighbours of the frontier through the transition matrix
+        rows = M[frontier]
+        row_len = np.diff(rows.indptr)
+        mass = (1.0 - alpha) * rows.data * np.repeat(r_f, row_len)
+        targets, inverse = np.unique(rows.indices, return_inverse=True)
+        residual[targets] += np.bincount(inverse, weights=mass, minlength=targets.size)
+
+        # Dangling nodes: the walk restarts from the personalization vector
+        dangling = row_len == 0
+        if dangling.any():
+            residual[seed_idx] += (1.0 - alpha) * r_f[dangling].sum() * seed_val
+            targets = np.union1d(targets, seed_idx)
+
+        touched[targets] = True
+        frontier = targets[residual[targets] > threshold[targets]]
+
+    nodes = np.flatnonzero(estimate > 0.0)
+    scores = sparse.csr_matrix(
+        (estimate[nodes], (np.zeros(nodes.size, dtype=np.int64), nodes)),
+        shape=(1, n),
+    )
+    residual_mass = float(residual.sum())
+
+    if report is not None:
+        report.solver = "push"
+        report.n_iter = n_pushes
+        report.converged = True
+        report.residuals.append(residual_mass)
+        report.setup_time += t_solve - t_start
+        report.solve_time += time.perf_counter() - t_solve
+        report.extra["touched_nodes"] = int(touched.sum())
+        report.extra["rounds"] = n_rounds
+        report.extra["dense_rounds"] = n_dense
+        report.finish()
+
+    return scores, n_pushes, residual_mass
+
+
+def reverse_push(
+    A: Union[sparse.spmatrix, PreparedGraph],
+    target: int,
+    alpha: float = 0.15,
+    personalize: Optional[np.ndarray] = None,
+    epsilon: float = 1e-6,
+    frontier_density: float = 0.1,
+) -> Tuple[np.ndarray, np.ndarray, float, float]:
+    """
+    Backward (reverse) push towards a single target node.
+
+    Computes, for every source s, an estimate of the PPR contribution
+    pi_s(target) by pushing residual mass backwards along in-edges of the
+    target, so only the target's in-neighbourhood is visited.
+
+    Dangling nodes restart from the personalization vector (as in
+    ppr_power.py), i.e. every dangling node has an edge to each seed.
+    Those edges are shared by all dangling nodes, so their estimate and
+    residual are kept as one group value instead of per node. Pushing the
+    group owes residual to every node that steps into the dangling set;
+    only the shares above epsilon are added right away, the rest once at
+    the end, so a group push costs the nodes it can activate.
+
+    Pushes run in synchronous rounds. A round whose frontier holds more
+    than frontier_density * n nodes pushes the whole residual vector with
+    one sparse product instead (as in personalized_pagerank_push).
+
+    Invariant, for every source s:
+        pi_s(target) = estimate[s] + sum_v pi_s(v) * residual[v]
+    where dangling nodes add dangling_estimate / dangling_residual to
+    their entries.
+
+    Parameters
+    ----------
+    A : scipy.sparse.csr_matrix or PreparedGraph
+        Adjacency matrix of the graph, or its prepared transition structure.
+    target : int
+        Node whose incoming PPR contributions are computed.
+    alpha : float
+        Teleport probability, in (0, 1).
+    personalize : np.ndarray, optional
+        Personalization vector (defines where dangling nodes restart).
+        If None, uniform distribution is used.
+    epsilon : float
+        Absolute residual threshold.
+    frontier_density : float
+        Fraction of the nodes above which a round is done densely.
+
+    Returns
+    -------
+    estimate : np.ndarray
+        Per-node estimate of pi_s(target).
+    residual : np.ndarray
+        Per-node remaining residual.
+    dangling_estimate : float
+        Estimate shared by every dangling node.
+    dangling_residual : float
+        Residual shared by every dangling node.
+    """
+    if alpha <= 0.0 or alpha >= 1.0:
+        raise ValueError("alpha must be in (0, 1)")
+    if epsilon <= 0.0:
+        raise ValueError("epsilon must be positive")
+    if not 0.0 < frontier_density <= 1.0:
+        raise ValueError("frontier_density must be in (0, 1]")
+
+    G = prepare_graph(A)
+    n = G.n_nodes
+    if not 0 <= target < n:
+        raise ValueError(f"target {target} is not a node index (n_nodes={n})")
+
+    seed_idx, seed_val = _seed_entries(personalize, n)
+
+    # p restricted to seeds, and the part of p that lands on dangling nodes
+    p_seed = np.zeros(n, dtype=np.float64)
+    p_seed[seed_idx] = seed_val
+    is_dangling = np.zeros(n, dtype=bool)
+    is_dangling[G.dangling] = True
+    p_dangling = float(seed_val[is_dangling[seed_idx]].sum())
+
+    # Nodes that step into the dangling set, largest probability first
+    inflow = G.dangling_inflow
+    inflow_idx = np.flatnonzero(inflow)
+    order = np.argsort(-inflow[inflow_idx])
+    inflow_idx = inflow_idx[order]
+    inflow_val = inflow[inflow_idx]
+
+    estimate = np.zeros(n, dtype=np.float64)
+    residual = np.zeros(n, dtype=np.float64)
+    dangling_estimate = 0.0
+    dangling_residual = 0.0
+
+    residual[target] = 1.0
+    frontier = np.array([target], dtype=np.int64)
+
+    dense_limit = frontier_density * n
+
+    # A push of the dangling group owes residual to every node of
+    # inflow_idx. Only the prefix whose total share exceeds epsilon is kept
+    # up to date; the other shares (each at most epsilon) are added at the
+    # end, so a group push costs the nodes it can activate, not |inflow_idx|.
+    group_pushed = 0.0
+    n_settled = 0
+
+    # Synchronous rounds: every node above the threshold is pushed at once,
+    # so the Python overhead is per round rather than per node.
+    while frontier.size > 0 or dangling_residual > epsilon:
+        candidates = []
+
+        if frontier.size > dense_limit:
+            # Dense round: push every residual with one sparse product
+            estimate += alpha * residual
+            dangling_residual += (1.0 - alpha) * float(residual @ p_seed)
+            residual = (1.0 - alpha) * (G.M @ residual)
+        elif frontier.size > 0:
+            r_f = residual[frontier]
+            estimate[frontier] += alpha * r_f
+            residual[frontier] = 0.0
+
+            # In-neighbours of the frontier through the transition matrix
+            rows = G.MT[frontier]
+            sources = rows.indices
+            mass = (1.0 - alpha) * rows.data * np.repeat(r_f, np.diff(rows.indptr))
+            touched, inverse = np.unique(sources, return_inverse=True)
+            residual[touched] += np.bincount(inverse, weights=mass)
+            candidates.append(touched)
+
+            # Every dangling node reaches a seed v with probability p[v]
+            dangling_residual += (1.0 - alpha) * float(r_f @ p_seed[frontier])
+
+        if dangling_residual > epsilon:
+            # Push the shared residual of the whole dangling group
+            d = dangling_residual
+            dangling_estimate += alpha * d
+            dangling_residual = (1.0 - alpha) * d * p_dangling
+            residual[inflow_idx[:n_settled]] += (1.0 - alpha) * d * inflow_val[:n_settled]
+            group_pushed += (1.0 - alpha) * d
+            k = int(np.searchsorted(-inflow_val, -epsilon / group_pushed))
+            residual[inflow_idx[n_settled:k]] += group_pushed * inflow_val[n_settled:k]
+            n_settled = max(n_settled, k)
+            candidates.append(inflow_idx[:n_settled])
+
+        if frontier.size > dense_limit:
+            frontier = np.flatnonzero(residual > epsilon)
+        elif candidates:
+            frontier = np.unique(np.concatenate(candidates))
+            frontier = frontier[residual[frontier] > epsilon]
+        else:
+            frontier = np.zeros(0, dtype=np.int64)
+
+    residual[inflow_idx[n_settled:]] += group_pushed * inflow_val[n_settled:]
+    return estimate, residual, dangling_estimate, dangling_residual
+
+
+def ppr_target_query(
+    A: Union[sparse.spmatrix, PreparedGraph],
+    target: int,
+    alpha: float = 0.15,
+    personalize: Optional[np.ndarray] = None,
+    epsilon: float = 1e-6,
+    top_k: int = 10,
+) -> Tuple[float, List[Tuple[int, float]], float]:
+    """
+    Score a single node for the current seed set with reverse push.
+
+    Parameters
+    ----------
+    A : scipy.sparse.csr_matrix or PreparedGraph
+        Adjacency matrix of the graph, or its prepared transition structure.
+    target : int
+        Node to score.
+    alpha : float
+        Teleport probability, in (0, 1).
+    personalize : np.ndarray, optional
+        Personalization vector. If None, uniform distribution is used.
+    epsilon : float
+        Absolute residual threshold of the reverse push.
+    top_k : int
+        Number of contributing seeds to return.
+
+    Returns
+    -------
+    score : float
+        Estimated PPR score of target.
+    top_seeds : list of (int, float)
+        Seeds with the largest contribution p[s] * pi_s(target), descending.
+    error_bound : float
+        Upper bound on |score - exact score|.
+    """
+    G = prepare_graph(A)
+    seed_idx, seed_val = _seed_entries(personalize, G.n_nodes)
+
+    estimate, residual, dangling_estimate, dangling_residual = reverse_push(
+        G, target, alpha=alpha, personalize=personalize, epsilon=epsilon
+    )
+
+    seed_est = estimate[seed_idx]
+    seed_is_dangling = np.isin(seed_idx, G.dangling)
+    seed_est[seed_is_dangling] += dangling_estimate
+
+    contributions = seed_val * seed_est
+    score = float(contributions.sum())
+
+    k = min(top_k, contributions.size)
+    order = np.argsort(contributions)[::-1][:k]
+    top_seeds = [
+        (int(seed_idx[i]), float(contributions[i]))
+        for i in order
+        if contributions[i] > 0.0
+    ]
+
+    # Every residual (plus the shared dangling residual) is at most epsilon
+    error_bound = float(residual.max(initial=0.0))
+    if G.dangling.size > 0:
+        error_bound += dangling_residual
+
+    return score, top_seeds, error_bound
@@ -0,0 +1,230 @@
+# src/algorithms/ppr_streaming.py
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from src.algorithms.ppr_incremental import update_ppr_incremental
+from src.algorithms.solve_report import SolveReport
+from src.data.graph_store import GraphStore
+
+Edge = Tuple[int, int, float]
+
+# Marks the end of the queue in background mode
+_STOP = object()
+
+
+def added_weights(store: GraphStore, edges: Iterable[Edge]) -> List[Edge]:
+    """New weights (s, d, current weight + amount) for store.set_edges."""
+    return [(s, d, store.weight(s, d) + w) for s, d, w in edges]
+
+
+class StreamingIngest:
+    """
+    Micro-batched edge ingest with one score refresh per batch.
+
+    Transactions (s, d, amount) arrive from an iterator (ingest) or from
+    other threads (submit, after start). They are collected in a window
+    that closes once it holds max_batch distinct edges or max_delay
+    seconds after its first transaction. Every transaction adds its amount
+    to the weight of edge (s, d), as build_adj_matrix sums duplicate
+    transactions, so repeated transactions on an edge within a window are
+    coalesced into one (s, d, summed amount) entry. Every closed window is
+    applied with a single call
+        update(edges, scores) -> new scores
+    and published as a new score version, so the per-batch cost (one
+    incremental solve) is shared by all edges of the batch.
+
+    Readers call latest() for a consistent (version, scores) pair.
+
+    Parameters
+    ----------
+    update : callable
+        Adds a batch of (s, d, amount) to the edge weights of the graph and
+        returns the new scores (see for_store for the GraphStore +
+        incremental PPR version, and added_weights).
+    scores : np.ndarray
+        Scores before the first batch (version 0).
+    max_batch : int
+        Distinct edges per batch.
+    max_delay : float
+        Seconds a batch stays open after its first edge.
+    on_publish : callable, optional
+        Called as on_publish(version, scores, n_edges) after each batch
+        (from the ingest thread in background mode).
+    report : SolveReport, optional
+        Accumulates ingest time, batches and edge counts.
+    """
+
+    def __init__(
+        self,
+        update: Callable[[List[Edge], np.ndarray], np.ndarray],
+        scores: np.ndarray,
+        max_batch: int = 1024,
+        max_delay: float = 0.25,
+        on_publish: Optional[Callable[[int, np.ndarray, int], None]] = None,
+        report: Optional[SolveReport] = None,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        if max_delay < 0:
+            raise ValueError("max_delay must be non-negative")
+
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.edges_received = 0
+        self.edges_applied = 0
+
+        self._update = update
+        self._on_publish = on_publish
+        self._report = report
+        self._lock = threading.Lock()
+        self._version = 0
+        self._scores = scores
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    @classmethod
+    def for_store(
+        cls,
+        store: GraphStore,
+        scores: np.ndarray,
+        personalize: np.ndarray,
+        alpha: float,
+        method: str = "push",
+        **kwargs,
+    ) -> "StreamingIngest":
+        """Pipeline that applies each batch with update_ppr_incremental on store."""
+        def update(edges: List[Edge], current: np.ndarray) -> np.ndarray:
+            _, new_scores = update_ppr_incremental(
+                store, current, personalize, alpha, added_weights(store, edges), method=method
+            )
+            return new_scores
+
+        return cls(update, scores, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Published scores
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def latest(self) -> Tuple[int, np.ndarray]:
+        """Most recently published (version, scores)."""
+        with self._lock:
+            return self._version, self._scores
+
+    def _flush(self, window: Dict[Tuple[int, int], float]) -> None:
+        """Apply one coalesced batch and publish the new scores."""
+        if not window:
+            return
+        edges = [(s, d, w) for (s, d), w in window.items()]
+        window.clear()
+
+        t_start = time.perf_counter()
+        scores = self._update(edges, self._scores)
+        with self._lock:
+            self._version += 1
+            self._scores = scores
+            version = self._version
+        self.edges_applied += len(edges)
+
+        if self._report is not None:
+            self._report.solver = "streaming"
+            self._report.n_iter = version
+            self._report.solve_time += time.perf_counter() - t_start
+            self._report.extra["edges_received"] = self.edges_received
+            self._report.extra["edges_applied"] = self.edges_applied
+        if self._on_publish is not None:
+            self._on_publish(version, scores, len(edges))
+
+    # ------------------------------------------------------------------
+    # Synchronous mode
+
+    def ingest(self, edges: Iterable[Edge]) -> int:
+        """
+        Consume an iterator of transactions, applying them batch by batch.
+
+        The delay is checked when an edge arrives (a blocking iterator
+        cannot close a window by itself; use start/submit for that).
+        Returns the number of versions published.
+        """
+        first_version = self._version
+        window: Dict[Tuple[int, int], float] = {}
+        opened = 0.0
+        for s, d, w in edges:
+            if w <= 0:
+                raise ValueError("Transaction amounts must be positive")
+            if not window:
+                opened = time.perf_counter()
+            key = (int(s), int(d))
+            window[key] = window.get(key, 0.0) + float(w)
+            self.edges_received += 1
+            if len(window) >= self.max_batch or time.perf_counter() - opened >= self.max_delay:
+                self._flush(window)
+        self._flush(window)
+        if self._report is not None:
+            self._report.converged = True
+            self._report.finish()
+        return self._version - first_version
+
+    # ------------------------------------------------------------------
+    # Background mode
+
+    def start(self) -> None:
+        """Start the ingest thread that reads edges passed to submit()."""
+        if self._thread is not None:
+            raise ValueError("The ingest thread is already running")
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, s: int, d: int, w: float) -> None:
+        """Queue one transaction (thread-safe)."""
+        if self._thread is None:
+            raise ValueError("Call start() before submit()")
+        if w <= 0:
+            raise ValueError("Transaction amounts must be positive")
+        self._queue.put((int(s), int(d), float(w)))
+
+    def stop(self) -> None:
+        """Apply the queued edges, stop the ingest thread and re-raise its error, if any."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        if self._report is not None:
+            self._report.converged = self._error is None
+            self._report.finish()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self) -> None:
+        window: Dict[Tuple[int, int], float] = {}
+        deadline = 0.0
+        try:
+            while True:
+                timeout = max(deadline - time.perf_counter(), 0.0) if window else None
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    self._flush(window)  # the window timed out
+                    continue
+
+                if item is _STOP:
+                    self._flush(window)
+                    break
+                if not window:
+                    deadline = time.perf_counter() + self.max_delay
+                s, d, w = item
+                window[(s, d)] = window.get((s, d), 0.0) + w
+                self.edges_received += 1
+                if len(window) >= self.max_batch:
+                    self._flush(window)
+        except BaseException as exc:  # reported by stop()
+            self._error = exc
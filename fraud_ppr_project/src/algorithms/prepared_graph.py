@@ -0,0 +1,205 @@
+# src/algorithms/prepared_graph.py
+
+from typing import Callable, Union
+import numpy as np
+from scipy import sparse
+from src.algorithms.alias_sampler import AliasSampler
+from src.algorithms.spmv import ParallelSpMV, scatter_rows_add, spmv_into
+from src.data.graph_store import GraphStore
+
+
+class PreparedGraph:
+    """
+    Transition structure of a graph, built once and shared by every PPR query.
+
+    Building the row-normalized transition matrix costs a full pass over the
+    edges plus a sparse product, so it is done here once per graph version
+    instead of inside each solver call.
+
+    Attributes
+    ----------
+    A : scipy.sparse.csr_matrix
+        Weighted adjacency matrix the structure was built from.
+    n_nodes : int
+        Number of nodes (dimension of A).
+    out_deg : np.ndarray
+        Weighted out-degree of every node.
+    dangling : np.ndarray
+        Indices of nodes without outgoing edges.
+    M : scipy.sparse.csr_matrix
+        Row-normalized transition matrix (rows = out-edges).
+    MT : scipy.sparse.csr_matrix
+        Transpose of M in CSR layout, so that ``MT @ r == r @ M``.
+    """
+
+    def __init__(self, A: sparse.spmatrix) -> None:
+        if not sparse.isspmatrix_csr(A):
+            A = A.tocsr()
+
+        n, m = A.shape
+        if n != m:
+            raise ValueError("Adjacency matrix A must be square")
+
+        # Out-degree
+        out_deg = np.asarray(A.sum(axis=1)).reshape(-1)
+
+        # Transition matrix M
+        k = np.where(out_deg > 0)[0]
+        inv_out = sparse.csr_matrix((1.0 / out_deg[k], (k, k)), shape=(n, n))
+        M = (inv_out @ A).tocsr()
+
+        self.A = A
+        self.n_nodes = n
+        self.out_deg = out_deg
+        self.dangling = np.where(out_deg == 0)[0]
+        self.M = M
+        self.MT = M.T.tocsr()
+        self._dangling_inflow = None
+        self._alias_sampler = None
+        self._MT_by_dtype = {np.dtype(np.float64): self.MT}
+        self._spmv_by_key = {}
+
+    def transposed(self, dtype=np.float64) -> sparse.csr_matrix:
+        """Return MT with the given value dtype (cached per dtype)."""
+        dtype = np.dtype(dtype)
+        if dtype not in self._MT_by_dtype:
+            self._MT_by_dtype[dtype] = self.MT.astype(dtype)
+        return self._MT_by_dtype[dtype]
+
+    def spmv(self, n_threads: int = 1, dtype=np.float64) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+        """
+        Return a function computing out = MT @ x in place, multithreaded
+        when n_threads > 1. Thread pools are cached per (n_threads, dtype).
+        """
+        MT = self.transposed(dtype)
+        if n_threads <= 1:
+            return lambda x, out: spmv_into(MT, x, out)
+
+        key = (n_threads, np.dtype(dtype))
+        if key not in self._spmv_by_key:
+            self._spmv_by_key[key] = ParallelSpMV(MT, n_threads)
+        return self._spmv_by_key[key]
+
+    @property
+    def dangling_inflow(self) -> np.ndarray:
+        """
+        Probability of stepping from each node into the dangling set
+        (row sums of M over the dangling columns), computed on first use.
+        """
+        if self._dangling_inflow is None:
+            indicator = np.zeros(self.n_nodes, dtype=np.float64)
+            indicator[self.dangling] = 1.0
+            self._dangling_inflow = self.M @ indicator
+        return self._dangling_inflow
+
+
+    @property
+    def alias_sampler(self) -> AliasSampler:
+        """O(1) weighted out-neighbour sampler over M, built on first use."""
+        if self._alias_sampler is None:
+            self._alias_sampler = AliasSampler(self.M)
+        return self._alias_sampler
+
+
+class BufferedGraph(PreparedGraph):
+    """
+    PreparedGraph view of a GraphStore, taken at one graph version.
+
+    Nothing is merged or transposed up front: spmv() computes
+        MT @ x = A_base.T @ (x / out_deg) + A_buffer.T @ (x / out_deg)
+    straight from the store's base CSR and its buffer of weight changes,
+    so the view costs O(n_nodes) to create. Solvers that need the
+    explicit matrices (M, MT, the alias sampler, ...) get them on first
+    access, from a merged copy of the graph.
+    """
+
+    def __init__(self, store: GraphStore) -> None:
+        base, src, dst, val, out_deg, out_count = store.snapshot()
+        n = out_deg.shape[0]
+
+        self.n_nodes = n
+        self.out_deg = out_deg
+        self.dangling = np.flatnonzero(out_count == 0)
+        self._base, self._src, self._dst, self._val = base, src, dst, val
+        self._inv_out = np.zeros(n, dtype=np.float64)
+        active = out_count > 0
+        self._inv_out[active] = 1.0 / out_deg[active]
+
+        self._full = None
+        self._spmv_by_key = {}
+
+    def _merged(self) -> PreparedGraph:
+        if self._full is None:
+            n, nb = self.n_nodes, self._base.shape[0]
+            base = self._base
+            if nb < n:
+                base = sparse.csr_matrix((base.data, base.indices, np.append(base.indptr, [base.indptr[-1]] * (n - nb))), shape=(n, n))
+            A = (base + sparse.csr_matrix((self._val, (self._src, self._dst)), shape=(n, n))).tocsr()
+            # Removed edges can leave rounding residue; rows whose edges
+            # were all removed must stay dangling
+            row = np.repeat(np.arange(n), np.diff(A.indptr))
+            A.data[self._inv_out[row] == 0.0] = 0.0
+            np.maximum(A.data, 0.0, out=A.data)
+            A.eliminate_zeros()
+            self._full = PreparedGraph(A)
+        return self._full
+
+    @property
+    def A(self) -> sparse.csr_matrix:
+        return self._merged().A
+
+    @property
+    def M(self) -> sparse.csr_matrix:
+        return self._merged().M
+
+    @property
+    def MT(self) -> sparse.csr_matrix:
+        return self._merged().MT
+
+    def transposed(self, dtype=np.float64) -> sparse.csr_matrix:
+        return self._merged().transposed(dtype)
+
+    @property
+    def dangling_inflow(self) -> np.ndarray:
+        return self._merged().dangling_inflow
+
+    @property
+    def alias_sampler(self) -> AliasSampler:
+        return self._merged().alias_sampler
+
+    def spmv(self, n_threads: int = 1, dtype=np.float64) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+        """
+        Return a function computing out = MT @ x through the base matrix
+        and the change buffer (n_threads is not used).
+        """
+        key = np.dtype(dtype)
+        if key in self._spmv_by_key:
+            return self._spmv_by_key[key]
+
+        base, src, dst, val = self._base, self._src, self._dst, self._val
+        n, nb = self.n_nodes, base.shape[0]
+        inv_out = self._inv_out
+        y = np.empty(n, dtype=np.float64)
+        acc = np.empty(n, dtype=np.float64)
+
+        def multiply(x: np.ndarray, out: np.ndarray) -> np.ndarray:
+            np.multiply(x, inv_out, out=y)
+            acc.fill(0.0)
+            # Base part: A_base.T @ y, with the CSR arrays read as CSC
+            scatter_rows_add(base, y[:nb], acc[:nb])
+            if src.size > 0:
+                np.add(acc, np.bincount(dst, weights=val * y[src], minlength=n), out=acc)
+            out[:] = acc
+            return out
+
+        self._spmv_by_key[key] = multiply
+        return multiply
+
+
+def prepare_graph(A: Union[sparse.spmatrix, PreparedGraph, GraphStore]) -> PreparedGraph:
+    """Return A as a PreparedGraph, building it only if needed."""
+    if isinstance(A, PreparedGraph):
+        return A
+    if isinstance(A, GraphStore):
+        return BufferedGraph(A)
+    return PreparedGraph(A)
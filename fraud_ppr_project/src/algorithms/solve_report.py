@@ -0,0 +1,68 @@
+# src/algorithms/solve_report.py
+
+import sys
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_memory_bytes() -> Optional[int]:
+    """Peak resident memory of this process in bytes, or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+class SolveReport:
+    """
+    Telemetry of one PPR solve.
+
+    Pass an instance as ``report=`` to a solver and it is filled in place;
+    the solver's return value is unchanged.
+    """
+
+    def __init__(self) -> None:
+        self.solver: str = ""
+        self.n_iter: int = 0
+        self.converged: bool = False
+
+        # Per-iteration trace
+        self.residuals: List[float] = []
+        self.iteration_times: List[float] = []
+        self.dangling_mass: List[float] = []
+
+        self.spmv_count: int = 0
+        self.setup_time: float = 0.0
+        self.solve_time: float = 0.0
+        self.peak_memory_bytes: Optional[int] = None
+
+        # Solver-specific values (extrapolations, top-K bound, walks, ...)
+        self.extra: Dict[str, float] = {}
+
+    def record_iteration(self, residual: float, elapsed: float, dangling_mass: Optional[float] = None) -> None:
+        """Append one iteration to the trace."""
+        self.residuals.append(float(residual))
+        self.iteration_times.append(float(elapsed))
+        if dangling_mass is not None:
+            self.dangling_mass.append(float(dangling_mass))
+
+    def finish(self) -> None:
+        """Record the memory high-water mark at the end of the solve."""
+        self.peak_memory_bytes = peak_memory_bytes()
+
+    def summary(self) -> str:
+        """One-line human readable summary."""
+        text = (
+            f"{self.solver}: {self.n_iter} iterations, {self.spmv_count} SpMV, "
+            f"setup {self.setup_time * 1000:.2f} ms, solve {self.solve_time * 1000:.2f} ms"
+        )
+        if self.residuals:
+            text += f", final residual {self.residuals[-1]:.2e}"
+        if not self.converged:
+            text += " (not converged)"
+        return text
@@ -0,0 +1,129 @@
+# src/algorithms/spmv.py
+
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from scipy import sparse
+
+# SciPy's compiled CSR kernel accumulates into a caller-provided array.
+# It is not public API, so fall back to the regular product if it moves.
+try:
+    from scipy.sparse._sparsetools import csc_matvec as _csc_matvec
+    from scipy.sparse._sparsetools import csr_matvec as _csr_matvec
+except ImportError:  # pragma: no cover - depends on SciPy internals
+    _csc_matvec = _csr_matvec = None
+
+
+def spmv_into(M: sparse.csr_matrix, x: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Compute out = M @ x for a CSR matrix without allocating a result array.
+
+    x and out must have the same dtype as M.data.
+    """
+    if _csr_matvec is not None:
+        out.fill(0)
+        _csr_matvec(M.shape[0], M.shape[1], M.indptr, M.indices, M.data, x, out)
+    else:
+        out[:] = M @ x
+    return out
+
+
+def scatter_rows_add(rows: sparse.csr_matrix, x: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Accumulate out += rows.T @ x in place, for a CSR matrix holding a few
+    rows of a larger matrix (x has one entry per row).
+
+    The cost is proportional to rows.nnz, independent of len(out).
+    """
+    if _csc_matvec is not None and out.dtype == rows.data.dtype == x.dtype:
+        # The CSR arrays of rows are the CSC arrays of rows.T
+        _csc_matvec(rows.shape[1], rows.shape[0], rows.indptr, rows.indices, rows.data, x, out)
+    else:
+        np.add.at(out, rows.indices, np.repeat(x, np.diff(rows.indptr)) * rows.data)
+    return out
+
+
+def balanced_row_blocks(indptr: np.ndarray, n_parts: int) -> list:
+    """
+    Split the rows of a CSR matrix into at most n_parts contiguous
+    (start, end) blocks holding about the same number of nonzeros.
+    """
+    if n_parts < 1:
+        raise ValueError("n_parts must be at least 1")
+
+    n_rows = indptr.shape[0] - 1
+    targets = np.linspace(0, indptr[-1], n_parts + 1)
+    bounds = np.searchsorted(indptr, targets).astype(np.int64)
+    bounds[0], bounds[-1] = 0, n_rows
+    bounds = np.maximum.accumulate(np.minimum(bounds, n_rows))
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+def csr_rows_into(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    n_cols: int,
+    x: np.ndarray,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute out = B @ x for a block of CSR rows given as raw arrays.
+
+    indptr must start at 0 and index into indices/data. The arrays may be
+    memory-mapped; they are read once, front to back.
+    """
+    n_rows = indptr.shape[0] - 1
+    if _csr_matvec is not None:
+        out.fill(0)
+        _csr_matvec(n_rows, n_cols, indptr, indices, data, x, out)
+    else:
+        B = sparse.csr_matrix((data, indices, indptr), shape=(n_rows, n_cols))
+        out[:] = B @ x
+    return out
+
+
+class ParallelSpMV:
+    """
+    Multithreaded CSR matrix-vector product.
+
+    The rows of M are split into n_threads contiguous blocks holding about
+    the same number of nonzeros, and each block is multiplied on a
+    persistent thread pool. SciPy's compiled kernel releases the GIL, so
+    the blocks run concurrently.
+    """
+
+    def __init__(self, M: sparse.csr_matrix, n_threads: int) -> None:
+        if n_threads < 1:
+            raise ValueError("n_threads must be at least 1")
+
+        self.M = M
+        self.n_threads = n_threads
+        self.blocks = balanced_row_blocks(M.indptr, n_threads)
+
+        self._pool = ThreadPoolExecutor(max_workers=n_threads) if len(self.blocks) > 1 else None
+
+    def _block(self, x: np.ndarray, out: np.ndarray, start: int, end: int) -> None:
+        M = self.M
+        y = out[start:end]
+        if _csr_matvec is not None:
+            # indptr keeps absolute offsets, so the full indices/data are passed
+            y.fill(0)
+            _csr_matvec(end - start, M.shape[1], M.indptr[start:end + 1], M.indices, M.data, x, y)
+        else:
+            y[:] = M[start:end] @ x
+
+    def __call__(self, x: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Compute out = M @ x."""
+        if self._pool is None:
+            return spmv_into(self.M, x, out)
+
+        futures = [self._pool.submit(self._block, x, out, a, b) for a, b in self.blocks]
+        for future in futures:
+            future.result()
+        return out
+
+    def close(self) -> None:
+        """Shut the thread pool down."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
@@ -0,0 +1,410 @@
+# src/algorithms/walk_index.py
+
+import time
+from typing import Dict, Iterable, Optional, Tuple, Union
+import numpy as np
+from scipy import sparse
+from src.algorithms.ppr_monte_carlo import _WALK_CHUNK, _node_dtype
+from src.algorithms.ppr_power import _personalization
+from src.algorithms.prepared_graph import PreparedGraph, prepare_graph
+from src.algorithms.solve_report import SolveReport
+
+# Overflow entries (and abandoned visit slots) tolerated before the
+# inverted index is rebuilt and the visits compacted (as a fraction of
+# the stored visits, with a floor for small indexes)
+_OVERFLOW_FRACTION = 0.5
+_OVERFLOW_MIN = 1 << 16
+
+
+def _segment_steps(lengths: np.ndarray) -> np.ndarray:
+    """0, 1, ..., length - 1 for every length, concatenated."""
+    starts = np.cumsum(lengths) - lengths
+    return np.arange(int(lengths.sum()), dtype=np.int64) - np.repeat(starts, lengths)
+
+
+def _transition_row(weights: np.ndarray) -> np.ndarray:
+    """Transition probabilities of a row (uniform if all weights are zero, as in AliasSampler)."""
+    total = weights.sum()
+    if total > 0:
+        return weights / total
+    return np.full(weights.size, 1.0 / max(weights.size, 1))
+
+
+class WalkIndex:
+    """
+    Stored Monte Carlo walks that can be updated when the graph changes
+    (in the spirit of Bahmani, Chowdhury & Goel, "Fast incremental and
+    personalized PageRank").
+
+    The walks follow personalized_pagerank_monte_carlo: each starts at a
+    node drawn from the personalization vector, continues with
+    probability 1 - alpha to a neighbour drawn in proportion to the edge
+    weights, and stops on the teleport coin, at a dangling node or after
+    max_steps visits. scores() is the same estimator. The walks are also
+    drawn the same way (the vectorized engine, one random stream per
+    batch of walks spawned from np.random.SeedSequence(seed)), so for the
+    same seed and batch_size the index holds exactly the walks behind the
+    scores of personalized_pagerank_monte_carlo. Updates draw from one
+    more stream. Walks returned by personalized_pagerank_monte_carlo
+    (return_walks=True) can also be passed in directly, so they are not
+    simulated twice; num_walks is then taken from them.
+
+    Storage is array-backed, in CSR style:
+        visits   nodes visited by all walks, concatenated (int32 while
+                 the node ids fit)
+        offsets  start of every walk in visits
+        lengths  number of visits of every walk
+        counts   visits per node
+    A walk rerouted by an update is rewritten at the end of visits and
+    its old slots are abandoned. An inverted index maps every node to the
+    positions w * max_steps + t where it is visited: a CSR part built in
+    bulk and an append-only overflow for suffixes written since. Entries
+    are checked against the walks on lookup, so stale ones are simply
+    skipped; the index is rebuilt, and visits compacted, when the
+    overflow or the abandoned slots grow too large.
+
+    set_edge(s, d, w) only touches walks that visit s. At every visit
+    after which the walk moved on, the move is kept with probability
+    min(1, P_new(y) / P_old(y)) for the node y it moved to, and otherwise
+    redrawn from the normalized excess (P_new - P_old)+ (a maximal
+    coupling of the old and new rows); a walk that stopped at a formerly
+    dangling s redraws its continue coin. The suffix after the first
+    changed move is simulated again on the new graph. For a new edge this
+    reroutes a walk through s to d with probability w / (new out-weight).
+    """
+
+    def __init__(
+        self,
+        A: Union[sparse.spmatrix, PreparedGraph],
+        alpha: float = 0.15,
+        personalize: Optional[np.ndarray] = None,
+        num_walks: int = 1000,
+        max_steps: int = 50,
+        seed: Optional[int] = None,
+        batch_size: int = _WALK_CHUNK,
+        walks: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> None:
+        if alpha <= 0.0 or alpha >= 1.0:
+            raise ValueError("alpha must be in (0, 1)")
+        if walks is not None:
+            num_walks = walks[1].size
+        if num_walks < 1 or max_steps < 1 or batch_size < 1:
+            raise ValueError("num_walks, max_steps and batch_size must be at least 1")
+
+        G = prepare_graph(A)
+        n = G.n_nodes
+
+        personalize = _personalization(personalize, n)
+
+        self.alpha = alpha
+        self.num_walks = num_walks
+        self.max_steps = max_steps
+        self.n_nodes = n
+
+        # Graph: the prepared base graph plus the rows changed since
+        self._A = G.A
+        self._base_n = n
+        self._sampler = G.alias_sampler
+        self._degree = self._sampler.degree.copy()
+        self._changed = np.zeros(n, dtype=bool)
+        self._rows: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._cdf: Dict[int, np.ndarray] = {}
+
+        # Walk storage
+        self.visits = np.zeros(0, dtype=_node_dtype(n))
+        self.offsets = np.zeros(num_walks, dtype=np.int64)
+        self.lengths = np.zeros(num_walks, dtype=np.int64)
+        self.counts = np.zeros(n, dtype=np.int64)
+        self._used = 0  # slots of visits written so far
+        self._live = 0  # slots still part of a walk
+        self._ov_node = np.zeros(0, dtype=np.int64)
+        self._ov_pos = np.zeros(0, dtype=np.int64)
+        self._ov_size = 0
+
+        # Same batches and streams as personalized_pagerank_monte_carlo
+        chunk_starts = range(0, num_walks, batch_size)
+        streams = np.random.SeedSequence(seed).spawn(len(chunk_starts) + 1)
+        if walks is None:
+            seed_cdf = np.cumsum(personalize)
+            for start, stream in zip(chunk_starts, streams):
+                self._rng = np.random.default_rng(stream)
+                walk = np.arange(start, min(start + batch_size, num_walks))
+                nodes = np.searchsorted(seed_cdf, self._rng.random(walk.size) * seed_cdf[-1], side="right")
+                np.minimum(nodes, n - 1, out=nodes)
+                self._extend(walk, nodes, np.zeros(walk.size, dtype=np.int64), index=False)
+        else:
+            visits, lengths = walks
+            self.visits = np.asarray(visits, dtype=self.visits.dtype)
+            self.lengths = np.array(lengths, dtype=np.int64)
+            self.offsets = np.cumsum(self.lengths) - self.lengths
+            self.counts = np.bincount(self.visits, minlength=n).astype(np.int64)
+            self._used = self._live = self.visits.size
+        self._rng = np.random.default_rng(streams[-1])
+        self._rebuild_index()
+
+    # ------------------------------------------------------------------
+    # Results
+
+    def scores(self) -> np.ndarray:
+        """Monte Carlo PPR estimate (same scale as personalized_pagerank_monte_carlo)."""
+        return self.counts / (self.num_walks * self.max_steps)
+
+    def walk(self, w: int) -> np.ndarray:
+        """Nodes visited by walk w, in order."""
+        start = self.offsets[w]
+        return self.visits[start:start + self.lengths[w]].astype(np.int64)
+
+    def adjacency(self) -> sparse.csr_matrix:
+        """Weighted adjacency matrix of the current graph."""
+        base = self._A.tocoo()
+        keep = ~self._changed[base.row]
+        rows = [base.row[keep]]
+        cols = [base.col[keep]]
+        vals = [base.data[keep]]
+        for u, (targets, weights) in self._rows.items():
+            rows.append(np.full(targets.size, u))
+            cols.append(targets)
+            vals.append(weights)
+        n = self.n_nodes
+        return sparse.csr_matrix(
+            (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))), shape=(n, n)
+        )
+
+    # ------------------------------------------------------------------
+    # Graph updates
+
+    def set_edge(self, s: int, d: int, w: float) -> int:
+        """
+        Set the weight of edge (s, d) to w (adding the edge if needed; w = 0
+        removes it) and update the stored walks.
+
+        Returns the number of walks whose suffix was changed.
+        """
+        if w < 0:
+            raise ValueError("Edge weights must be non-negative")
+        self._grow(max(s, d) + 1)
+
+        old_targets, old_weights = self._row(s)
+        keep = old_targets != d
+        new_targets = np.append(old_targets[keep], d) if w > 0 else old_targets[keep]
+        new_weights = np.append(old_weights[keep], w) if w > 0 else old_weights[keep]
+
+        # Old and new transition rows over the union of their targets
+        union = np.union1d(old_targets, new_targets)
+        p_old = np.zeros(union.size)
+        p_new = np.zeros(union.size)
+        np.add.at(p_old, np.searchsorted(union, old_targets), _transition_row(old_weights))
+        np.add.at(p_new, np.searchsorted(union, new_targets), _transition_row(new_weights))
+
+        self._rows[s] = (new_targets, new_weights)
+        self._cdf[s] = np.cumsum(_transition_row(new_weights))
+        self._changed[s] = True
+        self._degree[s] = new_targets.size
+
+        return self._reroute(s, union, p_old, p_new)
+
+    def add_edges(self, edges: Iterable[Tuple[int, int, float]], report: Optional[SolveReport] = None) -> int:
+        """
+        Apply set_edge to every (s, d, w); return the number of walks changed.
+
+        report, if given, gets the update time and the number of rerouted walks.
+        """
+        t_start = time.perf_counter()
+        changed = sum(self.set_edge(int(s), int(d), float(w)) for s, d, w in edges)
+
+        if report is not None:
+            report.solver = "walk_index"
+            report.n_iter = changed
+            report.converged = True
+            report.solve_time += time.perf_counter() - t_start
+            report.extra["num_walks"] = self.num_walks
+            report.extra["walks_rerouted"] = changed
+            report.finish()
+        return changed
+
+    def _reroute(self, s: int, union: np.ndarray, p_old: np.ndarray, p_new: np.ndarray) -> int:
+        ms = self.max_steps
+        pos = self._visits(s)
+        if pos.size == 0:
+            return 0
+        walk, step = pos // ms, pos % ms
+        length = self.lengths[walk]
+        rng = self._rng
+
+        moved = step < length - 1
+        stopped = (step == length - 1) & (length < ms)
+        new_dangling = p_new.sum() == 0.0
+
+        # Moves out of s: keep with probability P_new(y) / P_old(y)
+        cut = np.zeros(pos.size, dtype=bool)
+        if moved.any():
+            nxt = self.visits[self.offsets[walk[moved]] + step[moved] + 1]
+            k = np.searchsorted(union, nxt)
+            ratio = p_new[k] / p_old[k]
+            cut[moved] = rng.random(ratio.size) >= ratio
+
+        # Walks that stopped at a formerly dangling s redraw the continue coin
+        if p_old.sum() == 0.0 and not new_dangling:
+            cut[stopped] = rng.random(int(stopped.sum())) > self.alpha
+
+        if not cut.any():
+            return 0
+
+        # Only the first change of every walk matters: its suffix is redrawn
+        walk_c, step_c, moved_c = walk[cut], step[cut], moved[cut]
+        _, first = np.unique(walk_c, return_index=True)
+        walk_c, step_c, moved_c = walk_c[first], step_c[first], moved_c[first]
+
+        self._truncate(walk_c, step_c + 1)
+        if new_dangling:
+            return walk_c.size
+
+        # Next node: from the excess of the new row for changed moves,
+        # from the new row itself for redrawn coins
+        excess = np.maximum(p_new - p_old, 0.0)
+        nxt = np.empty(walk_c.size, dtype=np.int64)
+        for dist, sel in ((excess, moved_c), (p_new, ~moved_c)):
+            if sel.any():
+                cdf = np.cumsum(dist)
+                k = np.searchsorted(cdf, rng.random(int(sel.sum())) * cdf[-1], side="right")
+                nxt[sel] = union[np.minimum(k, union.size - 1)]
+
+        self._extend(walk_c, nxt, step_c + 1)
+        limit = max(_OVERFLOW_MIN, _OVERFLOW_FRACTION * self._live)
+        if self._ov_size > limit or self._used - self._live > limit:
+            self._rebuild_index()
+        return walk_c.size
+
+    # ------------------------------------------------------------------
+    # Walk simulation
+
+    def _row(self, u: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Current out-edges (targets, weights) of u."""
+        if u in self._rows:
+            return self._rows[u]
+        if u < self._base_n:
+            start, end = self._A.indptr[u], self._A.indptr[u + 1]
+            return self._A.indices[start:end].astype(np.int64), self._A.data[start:end].astype(np.float64)
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+
+    def _sample(self, nodes: np.ndarray) -> np.ndarray:
+        """Draw one out-neighbour for every (non-dangling) node."""
+        out = np.empty(nodes.size, dtype=np.int64)
+        changed = self._changed[nodes]
+        if not changed.all():
+            out[~changed] = self._sampler.sample(nodes[~changed], self._rng)
+        if changed.any():
+            idx = np.flatnonzero(changed)
+            for u in np.unique(nodes[idx]):
+                sel = idx[nodes[idx] == u]
+                targets, cdf = self._rows[u][0], self._cdf[u]
+                k = np.searchsorted(cdf, self._rng.random(sel.size) * cdf[-1], side="right")
+                out[sel] = targets[np.minimum(k, targets.size - 1)]
+        return out
+
+    def _extend(self, walk: np.ndarray, nodes: np.ndarray, step: np.ndarray, index: bool = True) -> None:
+        """
+        Simulate walks from (nodes, step) on the current graph. Every walk
+        is written to a new region at the end of visits: its first step
+        visits (kept from its old region), then the new suffix.
+        """
+        ms = self.max_steps
+        kept = step.copy()
+        new_length = step + 1
+        parts = []
+        local = np.arange(walk.size)
+        while local.size > 0:
+            parts.append((local, step, nodes))
+            new_length[local] = step + 1
+            if nodes.size > self.n_nodes // 8:
+                self.counts += np.bincount(nodes, minlength=self.n_nodes)
+            else:
+                np.add.at(self.counts, nodes, 1)
+
+            alive = (self._rng.random(local.size) > self.alpha) & (self._degree[nodes] > 0) & (step + 1 < ms)
+            local, step = local[alive], step[alive] + 1
+            nodes = self._sample(nodes[alive])
+        local, step, nodes = (np.concatenate(part) for part in zip(*parts))
+
+        start = self._allocate(int(new_length.sum()))
+        offsets = start + np.cumsum(new_length) - new_length
+        if kept.any():
+            steps = _segment_steps(kept)
+            self.visits[np.repeat(offsets, kept) + steps] = self.visits[np.repeat(self.offsets[walk], kept) + steps]
+        self.visits[offsets[local] + step] = nodes
+        self.offsets[walk] = offsets
+        self.lengths[walk] = new_length
+        self._live += nodes.size
+        if index:
+            self._append_overflow(nodes, walk[local] * ms + step)
+
+    def _allocate(self, size: int) -> int:
+        """Reserve size slots at the end of visits; return the first."""
+        start, end = self._used, self._used + size
+        if end > self.visits.size:
+            self.visits = np.resize(self.visits, max(2 * self.visits.size, end, 1024))
+        self._used = end
+        return start
+
+    def _truncate(self, walk: np.ndarray, new_length: np.ndarray) -> None:
+        """Drop the visits of every walk from new_length on."""
+        dropped = self.lengths[walk] - new_length
+        slots = np.repeat(self.offsets[walk] + new_length, dropped) + _segment_steps(dropped)
+        np.subtract.at(self.counts, self.visits[slots], 1)
+        self.lengths[walk] = new_length
+        self._live -= int(dropped.sum())
+
+    def _grow(self, n: int) -> None:
+        """Make room for nodes added by an edge update (they start without edges)."""
+        if n <= self.n_nodes:
+            return
+        extra = n - self.n_nodes
+        self.counts = np.concatenate((self.counts, np.zeros(extra, dtype=np.int64)))
+        self._degree = np.concatenate((self._degree, np.zeros(extra, dtype=self._degree.dtype)))
+        self._changed = np.concatenate((self._changed, np.zeros(extra, dtype=bool)))
+        if n > np.iinfo(self.visits.dtype).max:
+            self.visits = self.visits.astype(np.int64)
+        self.n_nodes = n
+
+    # ------------------------------------------------------------------
+    # Inverted index
+
+    def _rebuild_index(self) -> None:
+        # Compact the walks into one contiguous run, in walk order
+        lengths = self.lengths
+        steps = _segment_steps(lengths)
+        self.visits = self.visits[np.repeat(self.offsets, lengths) + steps]
+        self.offsets = np.cumsum(lengths) - lengths
+        self._used = self._live = self.visits.size
+
+        pos = np.repeat(np.arange(self.num_walks, dtype=np.int64) * self.max_steps, lengths) + steps
+        order = np.argsort(self.visits)
+        self._pos = pos[order]
+        self._ptr = np.concatenate(([0], np.cumsum(np.bincount(self.visits, minlength=self.n_nodes))))
+        self._ov_size = 0
+
+    def _append_overflow(self, nodes: np.ndarray, pos: np.ndarray) -> None:
+        end = self._ov_size + nodes.size
+        if end > self._ov_node.size:
+            capacity = max(2 * self._ov_node.size, end, 1024)
+            self._ov_node = np.resize(self._ov_node, capacity)
+            self._ov_pos = np.resize(self._ov_pos, capacity)
+        self._ov_node[self._ov_size:end] = nodes
+        self._ov_pos[self._ov_size:end] = pos
+        self._ov_size = end
+
+    def _visits(self, u: int) -> np.ndarray:
+        """Sorted positions w * max_steps + t where u is currently visited."""
+        parts = []
+        if u + 1 < self._ptr.size:
+            parts.append(self._pos[self._ptr[u]:self._ptr[u + 1]])
+        if self._ov_size:
+            parts.append(self._ov_pos[:self._ov_size][self._ov_node[:self._ov_size] == u])
+        if not parts:
+            return np.zeros(0, dtype=np.int64)
+
+        pos = np.unique(np.concatenate(parts))
+        walk, step = pos // self.max_steps, pos % self.max_steps
+        valid = step < self.lengths[walk]
+        pos, walk, step = pos[valid], walk[valid], step[valid]
+        return pos[self.visits[self.offsets[walk] + step] == u]
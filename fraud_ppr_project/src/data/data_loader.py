@@ -1,4 +1,4 @@
-from typing import Dict, Tuple, List
+from typing import Dict, Iterator, Tuple, List
 import numpy as np
 from scipy import sparse
 from src.data.graph_utils import process_raw_graph_data
@@ -115,4 +115,29 @@ def build_adj_matrix(
     # Construct the sparse matrix
     # Duplicate edges are summed by default in CSR construction
     A = sparse.csr_matrix((weights, (src, dst)), shape=(n_nodes, n_nodes))
-    return A
\ No newline at end of file
+    return A
+
+def iter_edge_updates(path: str) -> Iterator[Tuple[int, int, float]]:
+    """
+    Stream transactions (src_id, dst_id, amount) with ORIGINAL node IDs
+    from a CSV file, one line at a time.
+
+    The format is that of load_transactions, except that the amount
+    column is optional: src_id, dst_id[, amount[, label]]. As there, a
+    missing or non-positive amount counts as 1.0 and labels are ignored
+    here. Lines with non-numeric IDs are skipped. Each transaction adds
+    its amount to the edge weight (build_adj_matrix sums duplicates the
+    same way).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        next(f, None)  # Header
+        for line in f:
+            parts = line.strip().split(",")
+            if len(parts) < 2:
+                continue
+            try:
+                s, d = int(parts[0]), int(parts[1])
+                w = float(parts[2]) if len(parts) > 2 and parts[2] != "" else 1.0
+            except ValueError:
+                continue
+            yield s, d, (w if w > 0 else 1.0)
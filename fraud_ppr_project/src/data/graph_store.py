@@ -0,0 +1,382 @@
+# src/data/graph_store.py
+
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+import numpy as np
+from scipy import sparse
+
+
+class GraphStore:
+    """
+    Mutable weighted graph: an immutable base CSR matrix plus an
+    append-only COO buffer of weight changes.
+
+    set_edge(s, d, w) never touches the base matrix. It appends the
+    difference between w and the current weight of (s, d) to the buffer
+    and updates the out-degree of s, so an edge insert costs O(1)
+    amortized (plus a binary search in the base row of s). The current
+    adjacency matrix is base + buffer, with duplicate entries summed, and
+    solvers multiply through both parts directly (see snapshot() and
+    BufferedGraph in prepared_graph.py).
+
+    Once the buffer holds compact_threshold entries, a background thread
+    merges it into a new base CSR. Writes made during the merge stay in
+    the buffer and are kept when the new base is swapped in.
+
+    The latest weight of every buffered edge is also kept in a dict per
+    source node, so lookups (weight, out_edges) are exact and do not scan
+    the buffer.
+
+    Attributes
+    ----------
+    version : int
+        Number of edge writes so far (a new graph version per write).
+    """
+
+    def __init__(self, A: sparse.spmatrix, compact_threshold: int = 1 << 16, background: bool = True) -> None:
+        A = sparse.csr_matrix(A, dtype=np.float64)
+        if A.shape[0] != A.shape[1]:
+            raise ValueError("Adjacency matrix A must be square")
+        if compact_threshold < 1:
+            raise ValueError("compact_threshold must be at least 1")
+        if not A.has_canonical_format or (A.data == 0.0).any():
+            # Sorted, duplicate-free rows without explicit zeros (on a copy:
+            # the caller's matrix is shared, not copied, when already clean)
+            A = A.copy()
+            A.sum_duplicates()
+            A.eliminate_zeros()
+
+        self.compact_threshold = compact_threshold
+        self.background = background
+        self.version = 0
+
+        self._lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+
+        self._base = A
+        self._n = A.shape[0]
+        self._out_deg = np.asarray(A.sum(axis=1)).reshape(-1)
+        self._out_count = np.diff(A.indptr).astype(np.int64)
+
+        # Buffer of weight differences; entry i was write number _offset + i
+        self._src = np.zeros(1024, dtype=np.int64)
+        self._dst = np.zeros(1024, dtype=np.int64)
+        self._val = np.zeros(1024, dtype=np.float64)
+        self._size = 0
+        self._offset = 0
+
+        # Latest weight and write number of every buffered edge, per source
+        self._pending: Dict[int, Dict[int, Tuple[float, int]]] = {}
+        self._has_pending = np.zeros(self._n, dtype=bool)
+
+    # ------------------------------------------------------------------
+    # Reading
+
+    @property
+    def n_nodes(self) -> int:
+        return self._n
+
+    @property
+    def buffered(self) -> int:
+        """Number of entries in the change buffer."""
+        return self._size
+
+    @property
+    def out_deg(self) -> np.ndarray:
+        """Weighted out-degree of every node."""
+        return self._out_deg[:self._n]
+
+    def _base_weight(self, s: int, d: int) -> float:
+        base = self._base
+        if s >= base.shape[0]:
+            return 0.0
+        start, end = base.indptr[s], base.indptr[s + 1]
+        k = start + np.searchsorted(base.indices[start:end], d)
+        if k < end and base.indices[k] == d:
+            return float(base.data[k])
+        return 0.0
+
+    def weight(self, s: int, d: int) -> float:
+        """Current weight of edge (s, d) (0 if there is no edge)."""
+        with self._lock:
+            return self._weight(s, d)
+
+    def _weight(self, s: int, d: int) -> float:
+        row = self._pending.get(s)
+        if row is not None and d in row:
+            return row[d][0]
+        return self._base_weight(s, d)
+
+    def out_edges(self, u: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Current out-edges (targets, weights) of u, sorted by target."""
+        with self._lock:
+            base = self._base
+            if u < base.shape[0]:
+                start, end = base.indptr[u], base.indptr[u + 1]
+                targets = base.indices[start:end].astype(np.int64)
+                weights = base.data[start:end].copy()
+            else:
+                targets = np.zeros(0, dtype=np.int64)
+                weights = np.zeros(0, dtype=np.float64)
+
+            row = self._pending.get(u)
+            if row:
+                changed = np.fromiter(row.keys(), dtype=np.int64, count=len(row))
+                values = np.array([w for w, _ in row.values()])
+                keep = ~np.isin(targets, changed)
+                targets = np.concatenate((targets[keep], changed))
+                weights = np.concatenate((weights[keep], values))
+                order = np.argsort(targets)
+                targets, weights = targets[order], weights[order]
+
+        nonzero = weights != 0.0
+        return targets[nonzero], weights[nonzero]
+
+    def out_edges_of(self, nodes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Current out-edges of several nodes at once.
+
+        Returns (owner, targets, weights), where owner[k] is the position
+        in nodes of the source of edge k. The base rows are sliced in one
+        step; rows with buffered changes add their buffer entries, summed
+        per edge. Edges removed through the buffer may remain as entries
+        with a rounding-level weight (use out_count for dangling checks).
+        """
+        nodes = np.asarray(nodes, dtype=np.int64)
+        with self._lock:
+            base = self._base
+            in_base = np.flatnonzero(nodes < base.shape[0])
+            rows = base[nodes[in_base]]
+            owner = np.repeat(in_base, np.diff(rows.indptr))
+            targets = rows.indices.astype(np.int64)
+            weights = rows.data
+
+            changed = np.flatnonzero(self._has_pending[nodes])
+            if changed.size == 0:
+                return owner, targets, weights
+
+            # Buffer entries whose source is one of the changed nodes
+            order = np.argsort(nodes[changed])
+            sorted_nodes = nodes[changed][order]
+            src = self._src[:self._size]
+            k = np.minimum(np.searchsorted(sorted_nodes, src), sorted_nodes.size - 1)
+            hit = sorted_nodes[k] == src
+            buf_owner = changed[order][k[hit]]
+            buf_targets = self._dst[:self._size][hit]
+            buf_weights = self._val[:self._size][hit]
+
+        # Sum base and buffered weights per (owner, target) on changed rows
+        is_changed = np.zeros(nodes.size, dtype=bool)
+        is_changed[changed] = True
+        keep = ~is_changed[owner]
+        merge_owner = np.concatenate((owner[~keep], buf_owner))
+        merge_targets = np.concatenate((targets[~keep], buf_targets))
+        key = merge_owner * np.int64(self._n) + merge_targets
+        uniq, inverse = np.unique(key, return_inverse=True)
+        merged = np.bincount(inverse, weights=np.concatenate((weights[~keep], buf_weights)), minlength=uniq.size)
+        live = merged > 0.0
+
+        return (
+            np.concatenate((owner[keep], uniq[live] // self._n)),
+            np.concatenate((targets[keep], uniq[live] % self._n)),
+            np.concatenate((weights[keep], merged[live])),
+        )
+
+    @property
+    def out_count(self) -> np.ndarray:
+        """Number of out-edges of every node (exact, unlike sums of weights)."""
+        return self._out_count[:self._n]
+
+    def snapshot(self) -> Tuple[sparse.csr_matrix, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Consistent view of the current graph for a solver.
+
+        Returns (base, src, dst, val, out_deg, out_count): the base matrix
+        (possibly smaller than n_nodes), the buffered differences, and
+        copies of the weighted and unweighted out-degrees. The buffer
+        arrays are views; later writes never change them.
+        """
+        with self._lock:
+            k, n = self._size, self._n
+            return (
+                self._base,
+                self._src[:k],
+                self._dst[:k],
+                self._val[:k],
+                self._out_deg[:n].copy(),
+                self._out_count[:n].copy(),
+            )
+
+    def to_csr(self) -> sparse.csr_matrix:
+        """Current adjacency matrix as a new CSR matrix (copies the graph)."""
+        with self._lock:
+            return self._merged(self._base, self._pending, self._n)
+
+    # ------------------------------------------------------------------
+    # Writing
+
+    def set_edge(self, s: int, d: int, w: float) -> None:
+        """Set the weight of edge (s, d) to w; w = 0 removes the edge."""
+        if s < 0 or d < 0:
+            raise ValueError("Node indices must be non-negative")
+        if w < 0:
+            raise ValueError("Edge weights must be non-negative")
+
+        with self._lock:
+            self._grow(max(s, d) + 1)
+            old = self._weight(s, d)
+            if w == old:
+                return
+
+            if self._size == self._src.size:
+                capacity = 2 * self._src.size
+                self._src = np.resize(self._src, capacity)
+                self._dst = np.resize(self._dst, capacity)
+                self._val = np.resize(self._val, capacity)
+            i = self._size
+            self._src[i], self._dst[i], self._val[i] = s, d, w - old
+            self._size += 1
+
+            self._pending.setdefault(s, {})[d] = (w, self._offset + i)
+            self._has_pending[s] = True
+            self._out_deg[s] += w - old
+            self._out_count[s] += int(w != 0.0) - int(old != 0.0)
+            if self._out_count[s] == 0:
+                self._out_deg[s] = 0.0  # no rounding left on dangling nodes
+            self.version += 1
+
+            start = self._size >= self.compact_threshold and self._compactor is None
+        if start:
+            self.compact(wait=not self.background)
+
+    def has_edge(self, s: int, d: int) -> bool:
+        """Whether edge (s, d) exists (with a nonzero weight)."""
+        return 0 <= s < self._n and 0 <= d < self._n and self.weight(s, d) != 0.0
+
+    def remove_edge(self, s: int, d: int) -> None:
+        """Delete edge (s, d); it must exist."""
+        if not self.has_edge(s, d):
+            raise ValueError(f"No edge {s} -> {d} to remove")
+        self.set_edge(s, d, 0.0)
+
+    def reweight_edge(self, s: int, d: int, w: float) -> None:
+        """Change the weight of the existing edge (s, d) to w > 0."""
+        if w <= 0:
+            raise ValueError("Edge weight must be positive (use remove_edge to delete)")
+        if not self.has_edge(s, d):
+            raise ValueError(f"No edge {s} -> {d} to reweight")
+        self.set_edge(s, d, w)
+
+    def set_edges(self, edges: Iterable[Tuple[int, int, float]]) -> None:
+        """Apply set_edge to every (s, d, w)."""
+        for s, d, w in edges:
+            self.set_edge(int(s), int(d), float(w))
+
+    def _grow(self, n: int) -> None:
+        """Make room for new nodes (amortized O(1) per node)."""
+        if n <= self._n:
+            return
+        if n > self._out_deg.size:
+            capacity = max(n, 2 * self._out_deg.size)
+            out_deg = np.zeros(capacity, dtype=np.float64)
+            out_deg[:self._n] = self._out_deg[:self._n]
+            out_count = np.zeros(capacity, dtype=np.int64)
+            out_count[:self._n] = self._out_count[:self._n]
+            has_pending = np.zeros(capacity, dtype=bool)
+            has_pending[:self._n] = self._has_pending[:self._n]
+            self._out_deg, self._out_count, self._has_pending = out_deg, out_count, has_pending
+        self._n = n
+
+    # ------------------------------------------------------------------
+    # Compaction
+
+    @staticmethod
+    def _merged(base: sparse.csr_matrix, pending: Dict[int, Dict[int, Tuple[float, int]]], n: int) -> sparse.csr_matrix:
+        """Base matrix with the buffered weights written over it, as an n x n CSR."""
+        coo = base.tocoo()
+        src = np.fromiter((s for s, row in pending.items() for _ in row), dtype=np.int64)
+        dst = np.fromiter((d for row in pending.values() for d in row), dtype=np.int64)
+        val = np.fromiter((w for row in pending.values() for w, _ in row.values()), dtype=np.float64)
+
+        overridden = np.isin(coo.row.astype(np.int64) * n + coo.col, src * n + dst)
+        keep = ~overridden
+        A = sparse.csr_matrix(
+            (
+                np.concatenate((coo.data[keep], val)),
+                (np.concatenate((coo.row[keep], src)), np.concatenate((coo.col[keep], dst))),
+            ),
+            shape=(n, n),
+        )
+        A.eliminate_zeros()
+        return A
+
+    def compact(self, wait: bool = True) -> None:
+        """
+        Merge the change buffer into a new base matrix.
+
+        With wait=False the merge runs in a background thread; writes
+        continue meanwhile. Does nothing if a merge is already running.
+        """
+        with self._lock:
+            if self._compactor is not None:
+                if wait:
+                    thread = self._compactor
+                else:
+                    return
+            else:
+                thread = threading.Thread(target=self._compact, args=(
+                    self._base, {s: dict(row) for s, row in self._pending.items()},
+                    self._n, self._offset + self._size,
+                ), daemon=True)
+                self._compactor = thread
+                thread.start()
+        if wait:
+            thread.join()
+
+    def _compact(self, base, pending, n, upto) -> None:
+        """Build the merged matrix outside the lock, then swap it in."""
+        try:
+            A = self._merged(base, pending, n)
+            deg = np.asarray(A.sum(axis=1)).reshape(-1)
+        except BaseException:
+            with self._lock:
+                self._compactor = None
+            raise
+
+        with self._lock:
+            # Drop the merged part of the buffer (into new arrays: snapshots
+            # may still hold views of the old ones) and the buffered weights
+            # that were not written again since the snapshot
+            done = upto - self._offset
+            rest = self._size - done
+            for name in ("_src", "_dst", "_val"):
+                old = getattr(self, name)
+                new = np.zeros(max(old.size // 2, rest, 1024), dtype=old.dtype)
+                new[:rest] = old[done:self._size]
+                setattr(self, name, new)
+            self._size = rest
+            self._offset = upto
+
+            for s in list(self._pending):
+                row = self._pending[s]
+                for d in [d for d, (_, seq) in row.items() if seq < upto]:
+                    del row[d]
+                if not row:
+                    del self._pending[s]
+                    self._has_pending[s] = False
+
+            # Exact out-degrees: new base plus the remaining differences
+            out_deg = self._out_deg
+            out_deg[:] = 0.0
+            out_deg[:n] = deg
+            np.add.at(out_deg, self._src[:rest], self._val[:rest])
+            out_deg[self._out_count == 0] = 0.0
+
+            self._base = A
+            self._compactor = None
+
+    def wait(self) -> None:
+        """Block until a running background compaction has finished."""
+        thread = self._compactor
+        if thread is not None:
+            thread.join()
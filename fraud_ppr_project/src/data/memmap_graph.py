@@ -0,0 +1,170 @@
+import json
+import os
+from typing import Iterator, Tuple
+import numpy as np
+
+_META_FILE = "meta.json"
+
+
+def _chunks(n_edges: int, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    for start in range(0, n_edges, chunk_size):
+        yield start, min(start + chunk_size, n_edges)
+
+
+def write_memmap_graph(
+    directory: str,
+    src: np.ndarray,
+    dst: np.ndarray,
+    weights: np.ndarray,
+    n_nodes: int,
+    chunk_size: int = 1 << 22,
+    dtype: type = np.float64,
+) -> "MemmapGraph":
+    """
+    Write the transposed transition matrix of a graph to disk as .npy memmaps.
+
+    The edges are read in chunks of chunk_size, so src/dst/weights may
+    themselves be memory-mapped (np.load(..., mmap_mode="r")). Only arrays
+    of length n_nodes are held in RAM; the edge arrays are written
+    straight to disk in two passes.
+
+    Files written to directory:
+        indptr.npy   row pointers of MT (rows = destination nodes)
+        indices.npy  source node of each entry
+        data.npy     transition probability w / out_deg[source]
+        out_deg.npy  weighted out-degree of every node
+        meta.json    n_nodes, nnz
+
+    Duplicate edges are kept as separate entries; they add up in the
+    product exactly as the summed entries of build_adj_matrix do.
+
+    Parameters
+    ----------
+    directory : str
+        Output directory (created if missing).
+    src, dst : np.ndarray
+        Source and destination node indices (0 to n_nodes-1).
+    weights : np.ndarray
+        Edge weights.
+    n_nodes : int
+        Total number of nodes.
+    chunk_size : int
+        Number of edges processed per chunk.
+    dtype : type
+        Value dtype of data.npy (float64 or float32).
+
+    Returns
+    -------
+    MemmapGraph
+        The written graph, opened read-only.
+    """
+    if src.shape != dst.shape or src.shape != weights.shape:
+        raise ValueError("src, dst, and weights arrays must have the same shape")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    os.makedirs(directory, exist_ok=True)
+    n_edges = src.shape[0]
+    index_dtype = np.int32 if n_nodes < np.iinfo(np.int32).max else np.int64
+
+    # Pass 1: out-degrees and the row lengths of MT
+    out_deg = np.zeros(n_nodes, dtype=np.float64)
+    in_count = np.zeros(n_nodes, dtype=np.int64)
+    for a, b in _chunks(n_edges, chunk_size):
+        s = np.asarray(src[a:b], dtype=np.int64)
+        d = np.asarray(dst[a:b], dtype=np.int64)
+        out_deg += np.bincount(s, weights=np.asarray(weights[a:b], dtype=np.float64), minlength=n_nodes)
+        in_count += np.bincount(d, minlength=n_nodes)
+
+    indptr = np.lib.format.open_memmap(
+        os.path.join(directory, "indptr.npy"), mode="w+", dtype=np.int64, shape=(n_nodes + 1,)
+    )
+    indptr[0] = 0
+    np.cumsum(in_count, out=indptr[1:])
+    del in_count
+
+    indices = np.lib.format.open_memmap(
+        os.path.join(directory, "indices.npy"), mode="w+", dtype=index_dtype, shape=(n_edges,)
+    )
+    data = np.lib.format.open_memmap(
+        os.path.join(directory, "data.npy"), mode="w+", dtype=dtype, shape=(n_edges,)
+    )
+
+    inv_out = np.zeros(n_nodes, dtype=np.float64)
+    has_out = out_deg > 0
+    inv_out[has_out] = 1.0 / out_deg[has_out]
+
+    # Pass 2: scatter every edge into the next free slot of its row
+    cursor = np.array(indptr[:-1])
+    for a, b in _chunks(n_edges, chunk_size):
+        s = np.asarray(src[a:b], dtype=np.int64)
+        d = np.asarray(dst[a:b], dtype=np.int64)
+        w = np.asarray(weights[a:b], dtype=np.float64)
+
+        order = np.argsort(d, kind="stable")
+        s, d, w = s[order], d[order], w[order]
+        rows, first, counts = np.unique(d, return_index=True, return_counts=True)
+        pos = cursor[d] + (np.arange(d.size) - np.repeat(first, counts))
+        cursor[rows] += counts
+
+        indices[pos] = s
+        data[pos] = w * inv_out[s]
+
+    indptr.flush()
+    indices.flush()
+    data.flush()
+    del indptr, indices, data
+
+    np.save(os.path.join(directory, "out_deg.npy"), out_deg)
+    with open(os.path.join(directory, _META_FILE), "w", encoding="utf-8") as f:
+        json.dump({"n_nodes": int(n_nodes), "nnz": int(n_edges)}, f)
+
+    return MemmapGraph(directory)
+
+
+class MemmapGraph:
+    """
+    Transposed transition matrix stored on disk (see write_memmap_graph).
+
+    indptr, indices and data are opened as read-only memmaps, so the edge
+    arrays are paged in from disk on demand and never copied into RAM.
+
+    Attributes
+    ----------
+    n_nodes : int
+        Number of nodes.
+    nnz : int
+        Number of stored entries.
+    indptr, indices, data : np.memmap
+        CSR arrays of MT, so that ``MT @ r == r @ M``.
+    out_deg : np.ndarray
+        Weighted out-degree of every node.
+    dangling : np.ndarray
+        Indices of nodes without outgoing edges.
+    """
+
+    def __init__(self, directory: str) -> None:
+        meta_path = os.path.join(directory, _META_FILE)
+        if not os.path.exists(meta_path):
+            raise ValueError(f"Not a memmap graph directory: {directory}")
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        self.directory = directory
+        self.n_nodes = int(meta["n_nodes"])
+        self.nnz = int(meta["nnz"])
+        self.indptr = np.load(os.path.join(directory, "indptr.npy"), mmap_mode="r")
+        self.indices = np.load(os.path.join(directory, "indices.npy"), mmap_mode="r")
+        self.data = np.load(os.path.join(directory, "data.npy"), mmap_mode="r")
+        self.out_deg = np.load(os.path.join(directory, "out_deg.npy"))
+        self.dangling = np.where(self.out_deg == 0)[0]
+
+    def row_blocks(self, block_nnz: int) -> np.ndarray:
+        """Row boundaries splitting MT into blocks of about block_nnz entries."""
+        if block_nnz < 1:
+            raise ValueError("block_nnz must be at least 1")
+        n_blocks = max(1, -(-self.nnz // block_nnz))
+        targets = np.linspace(0, self.nnz, n_blocks + 1)
+        bounds = np.searchsorted(self.indptr, targets).astype(np.int64)
+        bounds[0], bounds[-1] = 0, self.n_nodes
+        return np.unique(np.minimum(bounds, self.n_nodes))
@@ -1,13 +1,17 @@
 # gui/app.py
 from __future__ import annotations
 
+import os
 import tkinter as tk
 from tkinter import ttk
 from typing import Dict
 import numpy as np
 
 from src.data.data_loader import load_transactions, build_adj_matrix
+from src.data.graph_store import GraphStore
 from src.algorithms.ppr_power import make_personalization_vector, personalized_pagerank
+from src.algorithms.prepared_graph import PreparedGraph
+from src.algorithms.solve_report import SolveReport
 from src.evaluation.metrics import precision_at_k
 from .pages.manual_page import build_manual_page
 
@@ -30,13 +34,33 @@ class AppState:
         self.data_source: str | None = None
         self.self_algorithm: str | None = None
         self.execution_time: float = 0.0
+        self.last_report: SolveReport | None = None  # telemetry of the last solve
+
+        # Parsed manual entry; manual_page bumps the version on every submit
+        self.manual_data = None
+        self.manual_version: int = 0
 
 
         self.scores = None          # np.array
+        self.score_stderr = None    # np.array, standard errors (Monte Carlo only)
         self.labels = None          # dict
         self.precision_at_50 = None # float
         self.reverse_map = None
 
+        # Cached graph (reused across runs on the same dataset)
+        self.graph_key = None
+        self.graph_cache = None     # (A, prepared, labels, rev_map, n_nodes)
+
+        # Multiprocess engine (worker processes kept alive across runs)
+        self.mp_engine_key = None
+        self.mp_engine = None
+
+        # Current graph for edge updates (base matrix + buffered edges)
+        self.graph_store = None
+
+        # Stored walks of the last Monte Carlo run, for edge updates
+        self.walk_index = None
+
 
 class WizardApp(tk.Tk):
     def __init__(self) -> None:
@@ -113,87 +137,149 @@ class WizardApp(tk.Tk):
 
     def run_ppr(self, alpha: float, weighted: bool = True, algorithm: str = "power",
             # Optional parameters for Power iteration
-            max_iter: int = 100, tol: float = 1e-6,
+            max_iter: int = 100, tol: float = 1e-6, solver: str = "power",
+            n_threads: int = 1, stop_top_k: int = 0,
             # Optional parameters for Monte Carlo  
-            num_walks: int = 1000, max_steps: int = 50) -> None:
+            num_walks: int = 1000, max_steps: int = 50, seed: int | None = None,
+            confidence: float = 0.95, time_budget: float = 0.0,
+            # Optional parameters for Forward push
+            epsilon: float = 1e-7,
+            # Worker processes (multiprocess Power iteration, Monte Carlo)
+            n_workers: int = 2) -> None:
         """
         Executes the Personalized PageRank algorithm.
         Handles data loading (from manual entry or file), matrix construction,
         and result calculation.
         """
 
-        # --- Step 1: Determine Data Source and Load Data ---
+        # --- Step 1: Reuse the prepared graph if the dataset is unchanged ---
+        # The transition matrix only depends on the data source and the
+        # weighting mode, so repeated runs (new alpha, new algorithm) skip
+        # loading and preparation entirely. A file that changed on disk
+        # since the last load has a new modification time.
         if self.state.data_source == "manual":
-            # Retrieve pre-parsed data directly from the application state (RAM)
-            # This data was processed in the Manual Page
-            src, dst, weights, n_nodes, labels, rev_map = self.state.manual_data
-            print(f"Using Manually Entered Data. Total Nodes: {n_nodes}")
-
+            graph_key = ("manual", self.state.manual_version, weighted)
         else:
-            # Default behavior: Load from the selected CSV file
-            if not self.state.data_path:
-                raise ValueError("No dataset selected. Please go back and select a file.")
-
-            # Load and map the data using the data loader module
-            src, dst, weights, n_nodes, labels, rev_map = load_transactions(self.state.data_path)
-            print(f"Graph loaded from file: {self.state.data_path}. Total Nodes: {n_nodes}")
-
-        # --- Step 2: Handle weighted/unweighted mode ---
-        if not weighted:
-            print("Running in UNWEIGHTED mode: all edge weights set to 1.0")
-            weights = np.ones_like(weights, dtype=float)  # همه وزن‌ها = ۱
+            try:
+                mtime = os.path.getmtime(self.state.data_path)
+            except (OSError, TypeError):
+                mtime = None  # _load_graph reports the missing file
+            graph_key = ("file", self.state.data_path, mtime, weighted)
+
+        if self.state.graph_key == graph_key and self.state.graph_cache is not None:
+            A, G, labels, rev_map, n_nodes = self.state.graph_cache
+            print(f"Reusing prepared graph. Total Nodes: {n_nodes}")
         else:
-            print("Running in WEIGHTED mode: using original edge weights")
+            A, G, labels, rev_map, n_nodes = self._load_graph(weighted)
+            self.state.graph_key = graph_key
+            self.state.graph_cache = (A, G, labels, rev_map, n_nodes)
 
-        # --- Step 3: Store Metadata ---
+        # --- Step 2: Store Metadata ---
         # Save the reverse mapping dictionary to the state.
         # This is crucial for the Results Page to display real Node IDs instead of internal indices.
-        self.state.reverse_map = rev_map
-
-        # --- Step 4: Build Adjacency Matrix ---
-        # Build the sparse weighted adjacency matrix
-        A = build_adj_matrix(src, dst, weights, n_nodes)
+        # A copy is stored because incremental updates add new nodes to it.
+        self.state.reverse_map = dict(rev_map)
 
-        # --- Step 5: Prepare Personalization Vector ---
+        # --- Step 3: Prepare Personalization Vector ---
         # Identify seed nodes (confirmed fraudsters) from the labels dictionary
         fraud_seeds = [node for node, lab in labels.items() if lab == 1]
 
         # Create the personalization vector (distribution) based on seeds
         p = make_personalization_vector(n_nodes, fraud_seeds)
 
-        # --- Step 6: Run the Algorithm ---
+        # --- Step 4: Run the Algorithm ---
         print(f"Starting PPR execution (algorithm={algorithm}, alpha={alpha})...")
 
         self.state.last_algorithm = algorithm
+        self.state.score_stderr = None
+        self.state.walk_index = None
+        report = SolveReport()
 
         start_time = time.perf_counter()
         
-        if algorithm == "power":
+        if algorithm == "power" and solver != "power":
+            # Solve the PPR linear system with a Krylov method
+            from src.algorithms.ppr_power import personalized_pagerank_linear
+            result = personalized_pagerank_linear(
+                G,
+                alpha=alpha,
+                max_iter=max_iter,
+                tol=tol,
+                personalize=p,
+                method=solver,
+                n_threads=n_threads,
+                report=report,
+            )
+        elif algorithm == "power":
             # Use Power iteration algorithm
             from src.algorithms.ppr_power import personalized_pagerank as ppr_power
             result = ppr_power(
-                A,
+                G,
                 alpha=alpha,
                 max_iter=max_iter,
                 tol=tol,
                 personalize=p,
+                n_threads=n_threads,
+                stop_top_k=stop_top_k or None,
+                report=report,
+            )
+        elif algorithm == "multiprocess":
+            # Power iteration on worker processes sharing the graph in memory
+            result = self._multiprocess_engine(graph_key, G, n_workers).solve(
+                alpha=alpha,
+                max_iter=max_iter,
+                tol=tol,
+                personalize=p,
+                report=report,
             )
         elif algorithm == "monte_carlo":
             # Use Monte Carlo algorithm
             from src.algorithms.ppr_monte_carlo import personalized_pagerank_monte_carlo
             # Note: Monte Carlo parameters may be different
-            result = personalized_pagerank_monte_carlo(
-                A,
+            # stop_top_k > 0 keeps adding walks (up to num_walks) until
+            # the top-K is separated at the given confidence
+            result, self.state.score_stderr, walks = personalized_pagerank_monte_carlo(
+                G,
                 alpha=alpha,
                 personalize=p,
                 # These parameters should come from GUI
                 num_walks= num_walks,  
-                max_steps= max_steps
+                max_steps= max_steps,
+                seed=seed,
+                n_workers=n_workers,
+                stop_top_k=stop_top_k or None,
+                confidence=confidence,
+                time_budget=time_budget or None,
+                return_stderr=True,
+                return_walks=True,
+                report=report,
+            )
+        elif algorithm == "push":
+            # Use local forward-push algorithm (returns a sparse score vector)
+            from src.algorithms.ppr_push import personalized_pagerank_push
+            sparse_scores, _, _ = personalized_pagerank_push(
+                G,
+                alpha=alpha,
+                personalize=p,
+                epsilon=epsilon,
+                report=report,
             )
+            result = sparse_scores.toarray().ravel()
         else:
             raise ValueError(f"Unknown algorithm: {algorithm}")
         end_time = time.perf_counter()
         self.state.execution_time = end_time - start_time
+        self.state.last_report = report
+
+        if algorithm == "monte_carlo":
+            # Index the walks behind the scores (outside the timed solve),
+            # so edge updates only re-simulate the walks they affect
+            from src.algorithms.walk_index import WalkIndex
+            self.state.walk_index = WalkIndex(
+                G, alpha=alpha, personalize=p, max_steps=max_steps, seed=seed,
+                batch_size=report.extra["batch_size"], walks=walks,
+            )
+        print(report.summary())
         
         # Unpack the result (some implementations return a tuple of scores and iterations)
         if isinstance(result, tuple):
@@ -201,11 +287,11 @@ class WizardApp(tk.Tk):
         else:
             scores = result
 
-        # --- Step 7: Calculate Metrics ---
+        # --- Step 5: Calculate Metrics ---
         # Calculate Precision@50 to evaluate performance (if ground truth labels exist)
         prec50 = precision_at_k(scores, labels, k=50)
 
-        # --- Step 8: Update Application State ---
+        # --- Step 6: Update Application State ---
         # Store results in the state to be accessed by the Results Page
         self.state.scores = scores
         self.state.labels = labels
@@ -214,72 +300,216 @@ class WizardApp(tk.Tk):
         self.state.algorithm = algorithm
 
         # === NEW: Store data for incremental updates ===
-        self.state.adj_matrix = A  # CSR sparse matrix
+        # Edge inserts are buffered on top of A instead of rebuilding it
+        self.state.graph_store = GraphStore(A)
         self.state.personalization = p  # personalization vector
         self.state.alpha = alpha  # damping factor
-        self.state.compact_to_real = rev_map  # reverse mapping
+        self.state.compact_to_real = self.state.reverse_map  # reverse mapping
         self.state.real_to_compact = {v: k for k, v in rev_map.items()}  # forward mapping
 
+    def _multiprocess_engine(self, graph_key, G, n_workers: int):
+        """Return the worker pool for this graph, starting it if needed."""
+        from src.algorithms.ppr_multiprocess import SharedMemoryPPR
+
+        key = (graph_key, n_workers)
+        if self.state.mp_engine_key != key or self.state.mp_engine is None:
+            if self.state.mp_engine is not None:
+                self.state.mp_engine.close()
+            self.state.mp_engine = SharedMemoryPPR(G, n_workers)
+            self.state.mp_engine_key = key
+        return self.state.mp_engine
+
+    def _load_graph(self, weighted: bool):
+        """
+        Load the current dataset and build its adjacency matrix and
+        prepared transition structure.
+        """
+        # --- Determine Data Source and Load Data ---
+        if self.state.data_source == "manual":
+            # Retrieve pre-parsed data directly from the application state (RAM)
+            # This data was processed in the Manual Page
+            src, dst, weights, n_nodes, labels, rev_map = self.state.manual_data
+            print(f"Using Manually Entered Data. Total Nodes: {n_nodes}")
+
+        else:
+            # Default behavior: Load from the selected CSV file
+            if not self.state.data_path:
+                raise ValueError("No dataset selected. Please go back and select a file.")
+
+            # Load and map the data using the data loader module
+            src, dst, weights, n_nodes, labels, rev_map = load_transactions(self.state.data_path)
+            print(f"Graph loaded from file: {self.state.data_path}. Total Nodes: {n_nodes}")
+
+        # --- Handle weighted/unweighted mode ---
+        if not weighted:
+            print("Running in UNWEIGHTED mode: all edge weights set to 1.0")
+            weights = np.ones_like(weights, dtype=float)  # همه وزن‌ها = ۱
+        else:
+            print("Running in WEIGHTED mode: using original edge weights")
+
+        # --- Build Adjacency Matrix and Transition Structure ---
+        # Build the sparse weighted adjacency matrix
+        A = build_adj_matrix(src, dst, weights, n_nodes)
+        G = PreparedGraph(A)
+
+        return A, G, labels, rev_map, n_nodes
+
     def run_incremental_ppr(self, new_edges):
         """
         new_edges: list of (real_src, real_dst, weight)
         Note: The input edges use REAL node IDs (from UI).
         We must map them to COMPACT indices (0..N-1) for the algorithm.
+        Unknown IDs become new nodes. Returns True on success.
+        """
+        return self._update_edges(
+            new_edges, create_nodes=True, operation="set",
+            message=f"Updated scores with {len(new_edges)} new edge(s).",
+        )
+
+    def remove_edges(self, edges):
         """
+        edges: list of (real_src, real_dst) of existing edges to delete
+        (e.g. reversed or disputed transactions). Returns True on success.
+        """
+        return self._update_edges(
+            [(r_src, r_dst, 0.0) for r_src, r_dst in edges], create_nodes=False, operation="remove",
+            message=f"Removed {len(edges)} edge(s) and updated scores.",
+        )
+
+    def reweight_edges(self, edges):
+        """
+        edges: list of (real_src, real_dst, new_weight) for existing edges
+        (e.g. partial chargebacks). Returns True on success.
+        """
+        return self._update_edges(
+            edges, create_nodes=False, operation="reweight",
+            message=f"Changed the weight of {len(edges)} edge(s) and updated scores.",
+        )
+
+    def _compact_id(self, real_id, create: bool) -> int:
+        """Compact index of a real node ID, optionally adding it as a new node."""
+        if real_id in self.state.real_to_compact:
+            return self.state.real_to_compact[real_id]
+        if not create:
+            raise ValueError(f"Unknown node ID: {real_id}")
+        # New node
+        c_id = max(self.state.graph_store.n_nodes, len(self.state.compact_to_real))
+        self.state.real_to_compact[real_id] = c_id
+        self.state.compact_to_real[c_id] = real_id  # Update reverse map too
+        return c_id
+
+    def _update_edges(self, edges, create_nodes: bool, operation: str, message: str):
+        """Apply edge changes (real IDs) and refresh the scores incrementally."""
         import tkinter.messagebox as messagebox
-        
-        if self.state.scores is None or self.state.adj_matrix is None:
-            messagebox.showerror("Error", "No existing graph to update.")
-            return
 
-        from src.algorithms.ppr_incremental import update_ppr_incremental
+        if self.state.scores is None or self.state.graph_store is None:
+            messagebox.showerror("Error", "No existing graph to update.")
+            return False
 
+        store = self.state.graph_store
         try:
-            mapped_edges = []
-            current_max_idx = self.state.adj_matrix.shape[0] - 1
-            
             # Map Real IDs to Compact Indices
-            for r_src, r_dst, w in new_edges:
-                # Handle Source
-                if r_src in self.state.real_to_compact:
-                    c_src = self.state.real_to_compact[r_src]
-                else:
-                    # New node
-                    current_max_idx += 1
-                    c_src = current_max_idx
-                    self.state.real_to_compact[r_src] = c_src
-                    self.state.compact_to_real[c_src] = r_src # Update reverse map too
-                
-                if r_dst in self.state.real_to_compact:
-                    c_dst = self.state.real_to_compact[r_dst]
-                else:
-                    current_max_idx += 1
-                    c_dst = current_max_idx
-                    self.state.real_to_compact[r_dst] = c_dst
-                    self.state.compact_to_real[c_dst] = r_dst
-
+            mapped_edges = []
+            for r_src, r_dst, w in edges:
+                c_src = self._compact_id(r_src, create_nodes)
+                c_dst = self._compact_id(r_dst, create_nodes)
+                if operation != "set" and not store.has_edge(c_src, c_dst):
+                    raise ValueError(f"No edge {r_src} -> {r_dst} in the graph")
                 mapped_edges.append((c_src, c_dst, w))
 
-            new_adj, new_scores = update_ppr_incremental(
-                adj_matrix=self.state.adj_matrix,
-                old_scores=self.state.scores,
-                personalization_vec=self.state.personalization,
-                alpha=getattr(self.state, 'alpha', 0.85),
-                new_edges=mapped_edges
-            )
-
-            self.state.adj_matrix = new_adj
-            self.state.scores = new_scores
+            report = SolveReport()
+            self.state.scores = self._apply_edges(mapped_edges, operation, report)
+            self.state.last_report = report
+            print(report.summary())
 
             self.refresh_results_page()
-            messagebox.showinfo("Success", f"Updated scores with {len(new_edges)} new edge(s).")
+            messagebox.showinfo("Success", message)
+            return True
 
         except Exception as e:
-            messagebox.showerror("Error", f"Incremental update failed:{e}")
-            
+            messagebox.showerror("Error", f"Incremental update failed: {e}")
+            return False
+
+    def _apply_edges(self, mapped_edges, operation: str, report: SolveReport):
+        """Apply edge changes (compact IDs) to the graph and return the new scores."""
+        from src.algorithms.ppr_incremental import (
+            remove_edges_incremental,
+            reweight_edges_incremental,
+            update_ppr_incremental,
+        )
+
+        store = self.state.graph_store
+        if self.state.last_algorithm == "monte_carlo":
+            # Re-simulate only the stored walks that pass through the
+            # updated sources; the store is kept in step for lookups
+            index = self.state.walk_index
+            index.add_edges(mapped_edges, report=report)
+            store.set_edges(mapped_edges)
+            self.state.score_stderr = None
+            return index.scores()
+
+        # Push only the residual of the changed rows; large
+        # residuals fall back to a warm-started power iteration
+        args = dict(
+            old_scores=self.state.scores,
+            personalization_vec=self.state.personalization,
+            alpha=getattr(self.state, 'alpha', 0.85),
+            report=report,
+            method="push",
+        )
+        if operation == "remove":
+            return remove_edges_incremental(store, edges=[(s, d) for s, d, _ in mapped_edges], **args)
+        if operation == "reweight":
+            return reweight_edges_incremental(store, edges=mapped_edges, **args)
+        _, new_scores = update_ppr_incremental(store, new_edges=mapped_edges, **args)
+        return new_scores
+
+    def ingest_edges_csv(self, path: str, max_batch: int = 1024):
+        """
+        Stream transactions from a CSV file (see iter_edge_updates) into
+        the graph in micro-batches: each transaction adds its amount to the
+        edge weight, the transactions on an edge within a batch are summed
+        and every batch costs one incremental update. Returns the
+        StreamingIngest pipeline, or None on failure.
+        """
+        import tkinter.messagebox as messagebox
+        from src.algorithms.ppr_streaming import StreamingIngest, added_weights
+        from src.data.data_loader import iter_edge_updates
+
+        if self.state.scores is None or self.state.graph_store is None:
+            messagebox.showerror("Error", "No existing graph to update.")
+            return None
+
+        def update(edges, scores):
+            self.state.scores = scores
+            return self._apply_edges(added_weights(self.state.graph_store, edges), "set", SolveReport())
+
+        report = SolveReport()
+        pipeline = StreamingIngest(update, self.state.scores, max_batch=max_batch, report=report)
+        try:
+            edges = (
+                (self._compact_id(s, create=True), self._compact_id(d, create=True), w)
+                for s, d, w in iter_edge_updates(path)
+            )
+            pipeline.ingest(edges)
         except Exception as e:
-            messagebox.showerror("Error", f"Incremental update failed:{e}")
-        
+            messagebox.showerror("Error", f"Streaming update failed: {e}")
+            return None
+        finally:
+            # Keep every batch applied before a failure
+            self.state.scores = pipeline.latest()[1]
+
+        self.state.last_report = report
+        print(report.summary())
+
+        self.refresh_results_page()
+        messagebox.showinfo(
+            "Success",
+            f"Applied {pipeline.edges_received} transactions "
+            f"({pipeline.edges_applied} edge updates) in {pipeline.version} batches.",
+        )
+        return pipeline
+
     def refresh_results_page(self):
         if 3 in self.frames:
             self.frames[3].destroy()
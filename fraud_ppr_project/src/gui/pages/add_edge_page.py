@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, filedialog
 
 def build_add_edge_page(frame: ttk.Frame, app) -> None:
     """Page for adding new edges to the graph."""
@@ -19,7 +19,7 @@ def build_add_edge_page(frame: ttk.Frame, app) -> None:
     # --- Title (row 0) ---
     title = ttk.Label(
         frame,
-        text="Add New Edge to Graph",
+        text="Add, Remove or Reweight Edges",
         style="Title.TLabel",
         anchor="w",
     )
@@ -28,7 +28,8 @@ def build_add_edge_page(frame: ttk.Frame, app) -> None:
     # --- Explanation (row 1) ---
     info = ttk.Label(
         frame,
-        text="Add a new edge to update PPR scores without full recomputation.",
+        text="Add a new edge, remove a reversed transaction or change an edge weight;\n"
+             "PPR scores are updated without full recomputation.",
         style="Small.TLabel",
         anchor="w",
         justify="left",
@@ -36,7 +37,7 @@ def build_add_edge_page(frame: ttk.Frame, app) -> None:
     info.grid(row=1, column=0, columnspan=3, sticky="we", padx=24, pady=(0, 20))
 
     # --- Single Edge Input Frame (row 2) ---
-    single_frame = ttk.LabelFrame(frame, text="Add Single Edge", padding=15)
+    single_frame = ttk.LabelFrame(frame, text="Single Edge", padding=15)
     single_frame.grid(row=2, column=0, columnspan=3, sticky="we", padx=24, pady=(0, 12))
 
     # Source Node input
@@ -98,6 +99,32 @@ def build_add_edge_page(frame: ttk.Frame, app) -> None:
     )
     add_btn.pack(side="left")
 
+    reweight_btn = ttk.Button(
+        button_bar,
+        text="Change Weight",
+        command=lambda: change_edge_and_update(
+            app, "reweight", source_var, target_var, weight_var, status_label
+        ),
+    )
+    reweight_btn.pack(side="left", padx=(8, 0))
+
+    remove_btn = ttk.Button(
+        button_bar,
+        text="Remove Edge",
+        style="Danger.TButton",
+        command=lambda: change_edge_and_update(
+            app, "remove", source_var, target_var, weight_var, status_label
+        ),
+    )
+    remove_btn.pack(side="left", padx=(8, 0))
+
+    batch_btn = ttk.Button(
+        button_bar,
+        text="Stream Transactions (CSV)…",
+        command=lambda: load_edge_batch(app, status_label),
+    )
+    batch_btn.pack(side="left", padx=(8, 0))
+
 
 def add_edge_and_update(app, source_var, target_var, weight_var, status_label):
     """
@@ -172,4 +199,74 @@ def add_edge_and_update(app, source_var, target_var, weight_var, status_label):
         status_label.config(
             text=f"Error during PPR update: {str(e)}", 
             foreground="red"
-        )
\ No newline at end of file
+        )
+
+
+def change_edge_and_update(app, mode, source_var, target_var, weight_var, status_label):
+    """
+    Remove an existing edge (mode "remove") or change its weight
+    (mode "reweight") and update the PPR scores incrementally.
+    Both nodes and the edge must already exist.
+    """
+    try:
+        # --- Input Parsing and Validation ---
+        source = int(source_var.get())
+        target = int(target_var.get())
+        weight = float(weight_var.get()) if mode == "reweight" else 0.0
+
+        if source < 0 or target < 0:
+            raise ValueError("Node IDs must be non-negative integers")
+        if mode == "reweight" and weight <= 0:
+            raise ValueError("Edge weight must be a positive number")
+
+    except ValueError as e:
+        status_label.config(text=f"Invalid input: {e}")
+        return
+
+    # --- Graph Existence Check ---
+    if not hasattr(app.state, 'scores') or app.state.scores is None:
+        status_label.config(text="No graph loaded. Please run analysis first.")
+        return
+
+    if mode == "remove":
+        status_label.config(text=f"Removing edge ({source} → {target})...")
+        success = app.remove_edges([(source, target)])
+        done_text = "Edge removed successfully! PPR scores updated."
+    else:
+        status_label.config(text=f"Changing weight of ({source} → {target}) to {weight}...")
+        success = app.reweight_edges([(source, target, weight)])
+        done_text = "Edge weight changed successfully! PPR scores updated."
+
+    if success:
+        status_label.config(text=done_text, foreground="green")
+    else:
+        status_label.config(text="Failed to update PPR scores. Please check the edge.", foreground="red")
+
+
+def load_edge_batch(app, status_label):
+    """
+    Stream transactions (src, dst[, amount]) from a CSV file into the
+    graph in micro-batches; each transaction adds its amount to the edge
+    weight. Each batch costs a single incremental PPR update.
+    """
+    if not hasattr(app.state, 'scores') or app.state.scores is None:
+        status_label.config(text="No graph loaded. Please run analysis first.")
+        return
+
+    filepath = filedialog.askopenfilename(
+        title="Select transactions CSV",
+        filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+    )
+    if not filepath:
+        return
+
+    status_label.config(text="Streaming transactions...")
+    pipeline = app.ingest_edges_csv(filepath)
+
+    if pipeline is not None:
+        status_label.config(
+            text=f"Applied {pipeline.edges_received} transactions in {pipeline.version} batches.",
+            foreground="green",
+        )
+    else:
+        status_label.config(text="Failed to apply the edge batch. Please check the file.", foreground="red")
@@ -65,6 +65,7 @@ def build_manual_page(frame: ttk.Frame, app) -> None:
 
             app.state.data_source = "manual"
             app.state.manual_data = results
+            app.state.manual_version += 1
 
             n_nodes = results[3]
             print(f"Manual data parsed successfully. Total nodes: {n_nodes}")
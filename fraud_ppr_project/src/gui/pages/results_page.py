@@ -68,7 +68,7 @@ def build_results_page(frame: ttk.Frame, app) -> None:
 
     tree.column("rank", width=60, anchor="center")
     tree.column("node", width=80, anchor="center")
-    tree.column("score", width=120, anchor="center")
+    tree.column("score", width=180, anchor="center")
     tree.column("label", width=80, anchor="center")
 
     tree.grid(row=2, column=0, sticky="nsew", padx=24, pady=(0, 8))
@@ -84,12 +84,27 @@ def build_results_page(frame: ttk.Frame, app) -> None:
     # Check if results are available
     scores = app.state.scores
     labels = app.state.labels
+    stderr = getattr(app.state, "score_stderr", None)
 
     ms_time = app.state.execution_time * 1000
 
-    algo_name = "Power Iteration" if app.state.last_algorithm == "power" else "Monte Carlo"
+    algo_names = {
+        "power": "Power Iteration",
+        "monte_carlo": "Monte Carlo",
+        "push": "Forward Push",
+        "multiprocess": "Power Iteration (multiprocess)",
+    }
+    algo_name = algo_names.get(app.state.last_algorithm, app.state.last_algorithm)
     time_text = f"Method: {algo_name}  |  Time: {ms_time:.2f} ms"
 
+    report = getattr(app.state, "last_report", None)
+    if report is not None:
+        time_text += f"  |  Iterations: {report.n_iter}"
+        if report.spmv_count:
+            time_text += f"  |  SpMV: {report.spmv_count}"
+        if not report.converged:
+            time_text += "  (not converged)"
+
     time_label = ttk.Label(
         frame,
         text=time_text,
@@ -179,11 +194,16 @@ def build_results_page(frame: ttk.Frame, app) -> None:
             # Apply visual tag for fraud nodes
             tags = ("fraud",) if lab == 1 else ()
 
+            # Monte Carlo scores carry an error bar
+            score_text = f"{score:.6f}"
+            if stderr is not None:
+                score_text += f" ± {float(stderr[node]):.6f}"
+
             # Insert into table
             tree.insert(
                 "",
                 "end",
-                values=(idx, real_node_id, f"{score:.6f}", lab),
+                values=(idx, real_node_id, score_text, lab),
                 tags=tags,
             )
 
@@ -278,13 +298,12 @@ def build_results_page(frame: ttk.Frame, app) -> None:
         command=export_csv
     )
     
-    # Add Edge option (only for non-Monte Carlo algorithms)
-    if app.state.last_algorithm != "monte_carlo":
-        action_menu.add_separator()
-        action_menu.add_command(
-            label="➕ Add New Edge",
-            command=lambda: app.show_page(8)  # Add Edge page
-        )
+    # Edge editing (add / remove / reweight)
+    action_menu.add_separator()
+    action_menu.add_command(
+        label="➕ Add / Remove Edge",
+        command=lambda: app.show_page(8)  # Add Edge page
+    )
 
     # Close button
     close_btn = ttk.Button(
@@ -89,6 +89,22 @@ def build_run_page(frame: ttk.Frame, app) -> None:
     )
     monte_rb.pack(side="left", padx=12, pady=8)
 
+    push_rb = ttk.Radiobutton(
+        algorithm_frame,
+        text="Forward push (local)",
+        variable=algorithm_var,
+        value="push"
+    )
+    push_rb.pack(side="left", padx=12, pady=8)
+
+    multiprocess_rb = ttk.Radiobutton(
+        algorithm_frame,
+        text="Power iteration (multiprocess)",
+        variable=algorithm_var,
+        value="multiprocess"
+    )
+    multiprocess_rb.pack(side="left", padx=12, pady=8)
+
     # Dynamic Parameters Container
     params_container = ttk.Frame(frame)
     params_container.grid(row=4, column=0, columnspan=3, sticky="we", padx=24, pady=(0, 12))
@@ -103,12 +119,32 @@ def build_run_page(frame: ttk.Frame, app) -> None:
     for c in range(4):
         monte_params_frame.columnconfigure(c, weight=1)
 
+    # Forward push parameters frame
+    push_params_frame = ttk.LabelFrame(params_container, text="Parameters for Forward push")
+    for c in range(4):
+        push_params_frame.columnconfigure(c, weight=1)
+
+    # Multiprocess power iteration parameters frame
+    multiprocess_params_frame = ttk.LabelFrame(params_container, text="Parameters for multiprocess Power iteration")
+    for c in range(4):
+        multiprocess_params_frame.columnconfigure(c, weight=1)
+
     # Parameter variables
     alpha_var = tk.DoubleVar(value=0.15)
     max_iter_var = tk.IntVar(value=100)
     tol_var = tk.DoubleVar(value=1e-6)
+    solver_var = tk.StringVar(value="power")
+    threads_var = tk.IntVar(value=1)
+    stop_top_k_var = tk.IntVar(value=0)
     num_walks_var = tk.IntVar(value=1000)
     walk_length_var = tk.IntVar(value=50)
+    epsilon_var = tk.DoubleVar(value=1e-7)
+    workers_var = tk.IntVar(value=2)
+    mc_workers_var = tk.IntVar(value=1)
+    seed_var = tk.StringVar(value="")
+    mc_top_k_var = tk.IntVar(value=0)
+    confidence_var = tk.DoubleVar(value=0.95)
+    time_budget_var = tk.DoubleVar(value=0.0)
 
     def setup_power_params():
         """Create Power iteration parameter widgets."""
@@ -130,9 +166,31 @@ def build_run_page(frame: ttk.Frame, app) -> None:
         
         # Convergence tolerance
         ttk.Label(power_params_frame, text="Tolerance (L1):").grid(
-            row=2, column=0, sticky="w", padx=12, pady=(4,8))
+            row=2, column=0, sticky="w", padx=12, pady=4)
         ttk.Entry(power_params_frame, textvariable=tol_var).grid(
-            row=2, column=1, sticky="we", padx=(0,12), pady=(4,8))
+            row=2, column=1, sticky="we", padx=(0,12), pady=4)
+
+        # Solver (plain power iteration or a Krylov linear solver)
+        ttk.Label(power_params_frame, text="Solver:").grid(
+            row=3, column=0, sticky="w", padx=12, pady=4)
+        ttk.Combobox(
+            power_params_frame,
+            textvariable=solver_var,
+            values=("power", "bicgstab", "gmres"),
+            state="readonly",
+        ).grid(row=3, column=1, sticky="we", padx=(0,12), pady=4)
+
+        # Threads for the sparse matrix-vector products
+        ttk.Label(power_params_frame, text="Threads:").grid(
+            row=4, column=0, sticky="w", padx=12, pady=4)
+        ttk.Entry(power_params_frame, textvariable=threads_var).grid(
+            row=4, column=1, sticky="we", padx=(0,12), pady=4)
+
+        # Early stop once the top-K ranking is stable (power solver only)
+        ttk.Label(power_params_frame, text="Stop at stable top-K (0 = off):").grid(
+            row=5, column=0, sticky="w", padx=12, pady=(4,8))
+        ttk.Entry(power_params_frame, textvariable=stop_top_k_var).grid(
+            row=5, column=1, sticky="we", padx=(0,12), pady=(4,8))
 
     def setup_monte_params():
         """Create Monte Carlo parameter widgets."""
@@ -147,32 +205,130 @@ def build_run_page(frame: ttk.Frame, app) -> None:
             row=0, column=1, sticky="we", padx=(0,12), pady=(8,4))
         
         # Number of random walks
-        ttk.Label(monte_params_frame, text="Number of random walks:").grid(
+        ttk.Label(monte_params_frame, text="Number of random walks (max if adaptive):").grid(
             row=1, column=0, sticky="w", padx=12, pady=4)
         ttk.Entry(monte_params_frame, textvariable=num_walks_var).grid(
             row=1, column=1, sticky="we", padx=(0,12), pady=4)
         
         # Maximum walk length
         ttk.Label(monte_params_frame, text="Max walk length:").grid(
-            row=2, column=0, sticky="w", padx=12, pady=(4,8))
+            row=2, column=0, sticky="w", padx=12, pady=4)
         ttk.Entry(monte_params_frame, textvariable=walk_length_var).grid(
-            row=2, column=1, sticky="we", padx=(0,12), pady=(4,8))
+            row=2, column=1, sticky="we", padx=(0,12), pady=4)
+
+        # Random seed (same seed = same scores, for any worker count)
+        ttk.Label(monte_params_frame, text="Random seed (empty = random):").grid(
+            row=3, column=0, sticky="w", padx=12, pady=4)
+        ttk.Entry(monte_params_frame, textvariable=seed_var).grid(
+            row=3, column=1, sticky="we", padx=(0,12), pady=4)
+
+        # Worker processes
+        ttk.Label(monte_params_frame, text="Worker processes:").grid(
+            row=4, column=0, sticky="w", padx=12, pady=4)
+        ttk.Entry(monte_params_frame, textvariable=mc_workers_var).grid(
+            row=4, column=1, sticky="we", padx=(0,12), pady=4)
+
+        # Adaptive mode: stop once the top-K is separated with confidence
+        ttk.Label(monte_params_frame, text="Stop at confident top-K (0 = off):").grid(
+            row=5, column=0, sticky="w", padx=12, pady=4)
+        ttk.Entry(monte_params_frame, textvariable=mc_top_k_var).grid(
+            row=5, column=1, sticky="we", padx=(0,12), pady=4)
+
+        ttk.Label(monte_params_frame, text="Confidence level:").grid(
+            row=6, column=0, sticky="w", padx=12, pady=4)
+        ttk.Entry(monte_params_frame, textvariable=confidence_var).grid(
+            row=6, column=1, sticky="we", padx=(0,12), pady=4)
+
+        ttk.Label(monte_params_frame, text="Time budget in seconds (0 = none):").grid(
+            row=7, column=0, sticky="w", padx=12, pady=(4,8))
+        ttk.Entry(monte_params_frame, textvariable=time_budget_var).grid(
+            row=7, column=1, sticky="we", padx=(0,12), pady=(4,8))
+
+    def setup_push_params():
+        """Create Forward push parameter widgets."""
+        # Clear previous widgets
+        for widget in push_params_frame.winfo_children():
+            widget.destroy()
+
+        # Damping factor (alpha)
+        ttk.Label(push_params_frame, text="Damping factor (alpha):").grid(
+            row=0, column=0, sticky="w", padx=12, pady=(8,4))
+        ttk.Entry(push_params_frame, textvariable=alpha_var).grid(
+            row=0, column=1, sticky="we", padx=(0,12), pady=(8,4))
+
+        # Residual threshold per unit of degree
+        ttk.Label(push_params_frame, text="Residual threshold (epsilon):").grid(
+            row=1, column=0, sticky="w", padx=12, pady=(4,8))
+        ttk.Entry(push_params_frame, textvariable=epsilon_var).grid(
+            row=1, column=1, sticky="we", padx=(0,12), pady=(4,8))
+
+    def setup_multiprocess_params():
+        """Create multiprocess Power iteration parameter widgets."""
+        # Clear previous widgets
+        for widget in multiprocess_params_frame.winfo_children():
+            widget.destroy()
+
+        # Damping factor (alpha)
+        ttk.Label(multiprocess_params_frame, text="Damping factor (alpha):").grid(
+            row=0, column=0, sticky="w", padx=12, pady=(8,4))
+        ttk.Entry(multiprocess_params_frame, textvariable=alpha_var).grid(
+            row=0, column=1, sticky="we", padx=(0,12), pady=(8,4))
+
+        # Maximum iterations
+        ttk.Label(multiprocess_params_frame, text="Max iterations:").grid(
+            row=1, column=0, sticky="w", padx=12, pady=4)
+        ttk.Entry(multiprocess_params_frame, textvariable=max_iter_var).grid(
+            row=1, column=1, sticky="we", padx=(0,12), pady=4)
+
+        # Convergence tolerance
+        ttk.Label(multiprocess_params_frame, text="Tolerance (L1):").grid(
+            row=2, column=0, sticky="w", padx=12, pady=4)
+        ttk.Entry(multiprocess_params_frame, textvariable=tol_var).grid(
+            row=2, column=1, sticky="we", padx=(0,12), pady=4)
+
+        # Worker processes, each owning a row partition of the graph
+        ttk.Label(multiprocess_params_frame, text="Worker processes:").grid(
+            row=3, column=0, sticky="w", padx=12, pady=(4,8))
+        ttk.Entry(multiprocess_params_frame, textvariable=workers_var).grid(
+            row=3, column=1, sticky="we", padx=(0,12), pady=(4,8))
 
     def show_power_params():
         """Display Power iteration parameters."""
         monte_params_frame.pack_forget()
+        push_params_frame.pack_forget()
+        multiprocess_params_frame.pack_forget()
         power_params_frame.pack(fill="x", expand=True)
         setup_power_params()
 
     def show_monte_params():
         """Display Monte Carlo parameters."""
         power_params_frame.pack_forget()
+        push_params_frame.pack_forget()
+        multiprocess_params_frame.pack_forget()
         monte_params_frame.pack(fill="x", expand=True)
         setup_monte_params()
 
+    def show_push_params():
+        """Display Forward push parameters."""
+        power_params_frame.pack_forget()
+        monte_params_frame.pack_forget()
+        multiprocess_params_frame.pack_forget()
+        push_params_frame.pack(fill="x", expand=True)
+        setup_push_params()
+
+    def show_multiprocess_params():
+        """Display multiprocess Power iteration parameters."""
+        power_params_frame.pack_forget()
+        monte_params_frame.pack_forget()
+        push_params_frame.pack_forget()
+        multiprocess_params_frame.pack(fill="x", expand=True)
+        setup_multiprocess_params()
+
     # Initial setup
     setup_power_params()
     setup_monte_params()
+    setup_push_params()
+    setup_multiprocess_params()
     show_power_params()  # Default to Power iteration
 
     # Algorithm change event handler
@@ -182,6 +338,10 @@ def build_run_page(frame: ttk.Frame, app) -> None:
         """Handle algorithm selection change."""
         if algorithm_var.get() == "power":
             show_power_params()
+        elif algorithm_var.get() == "push":
+            show_push_params()
+        elif algorithm_var.get() == "multiprocess":
+            show_multiprocess_params()
         else:
             show_monte_params()
 
@@ -212,14 +372,38 @@ def build_run_page(frame: ttk.Frame, app) -> None:
                     "alpha": float(alpha_var.get()),
                     "max_iter": int(max_iter_var.get()),
                     "tol": float(tol_var.get()),
+                    "solver": solver_var.get(),
+                    "n_threads": int(threads_var.get()),
+                    "stop_top_k": int(stop_top_k_var.get()),
                     "weighted": weighted,
                     "algorithm": "power"
                 }
+            elif algorithm == "push":
+                params = {
+                    "alpha": float(alpha_var.get()),
+                    "epsilon": float(epsilon_var.get()),
+                    "weighted": weighted,
+                    "algorithm": "push"
+                }
+            elif algorithm == "multiprocess":
+                params = {
+                    "alpha": float(alpha_var.get()),
+                    "max_iter": int(max_iter_var.get()),
+                    "tol": float(tol_var.get()),
+                    "n_workers": int(workers_var.get()),
+                    "weighted": weighted,
+                    "algorithm": "multiprocess"
+                }
             else:  # monte_carlo
                 params = {
                     "alpha": float(alpha_var.get()),
                     "num_walks": int(num_walks_var.get()),
                     "max_steps": int(walk_length_var.get()),
+                    "seed": int(seed_var.get()) if seed_var.get().strip() else None,
+                    "n_workers": int(mc_workers_var.get()),
+                    "stop_top_k": int(mc_top_k_var.get()),
+                    "confidence": float(confidence_var.get()),
+                    "time_budget": float(time_budget_var.get()),
                     "weighted": weighted,
                     "algorithm": "monte_carlo"
                 }